@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures for the FitScore Calculator API tests
+"""
+
+import os
+
+import httpx
+import pytest
+from uvicorn.importer import import_from_string
+
+# ASGI app under test, as "module:attribute"
+APP_SPEC = os.environ.get("FITSCORE_APP", "main:app")
+app = import_from_string(APP_SPEC)
+
+@pytest.fixture
+async def client():
+    """Async HTTP client routed straight into the ASGI app, with no server or socket"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
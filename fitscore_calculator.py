@@ -1,12 +1,43 @@
+import asyncio
+import bisect
+import copy
+import functools
+import hashlib
 import json
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
-from datetime import datetime
+import operator
+import time
+import weakref
+from typing import Dict, List, Literal, Optional, Set, Tuple, Any, Union
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+import httpx
 import openai
 import os
 from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict
+
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator, _KeywordIndex falls back to substring checks
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator, the JSON helpers fall back to the stdlib json module
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # Optional, long resumes are trimmed to an approximate character budget instead
+    tiktoken = None
+
+try:
+    import h2
+except ImportError:  # Optional, the shared OpenAI connection pool falls back to HTTP/1.1
+    h2 = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -16,11 +47,727 @@ logger = logging.getLogger(__name__)
 try:
     load_dotenv()
 except Exception as e:
-    logger.warning(f"Could not load .env file: {e}")
+    logger.warning("Could not load .env file: %s", e)
+
+# OpenAI model and per-step completion budgets shared by the realtime and Batch API paths.
+# Budgets follow each step's response schema: the weights are a handful of numbers and
+# the skills lists rarely pass 800 tokens, while the elite evaluation keeps its headroom.
+GPT4_MODEL = "gpt-4o-mini"
+GPT4_MAX_TOKENS = {
+    "context": 1000,
+    "smart_criteria": 1500,
+    "skills": 1200,
+    "elite_evaluation": 2000,
+    "weights": 400
+}
+# Fixed sampling seed so repeated evaluations of the same inputs score alike
+GPT4_SEED = 94032
+# The fused call answers every step in one response
+GPT4_MAX_TOKENS["fused"] = sum(GPT4_MAX_TOKENS.values())
+# A bulk call answers skills and elite evaluation for up to GPT4_BULK_MAX_CANDIDATES
+# resumes; the group size is bounded by gpt-4o-mini's 16k output token limit
+GPT4_BULK_MAX_CANDIDATES = 4
+GPT4_MAX_TOKENS["bulk"] = GPT4_BULK_MAX_CANDIDATES * (GPT4_MAX_TOKENS["skills"] + GPT4_MAX_TOKENS["elite_evaluation"])
+
+# Resumes are trimmed to this many prompt tokens so a pasted CV (or a whole portfolio)
+# cannot crowd out the job description and criteria; the approximate budget without
+# tiktoken assumes ~4 characters per token
+GPT4_MAX_RESUME_TOKENS = 6000
+GPT4_CHARS_PER_TOKEN = 4
+
+# Retries per GPT-4 call on rate limits (429), timeouts, connection errors and 5xx responses,
+# with the SDK's exponential backoff and jitter (honouring Retry-After); only failures that
+# survive every retry reach the heuristic fallbacks. The timeout bounds each attempt.
+GPT4_MAX_RETRIES = 3
+GPT4_TIMEOUT_SECONDS = 30.0
+
+# Connection pool limits for the HTTP client OpenAI clients share (see create_openai_http_client)
+OPENAI_MAX_CONNECTIONS = 100
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 50
+
+# Chat completions one calculator keeps in flight at once (an account's safe concurrency);
+# callers gathering many candidates queue here instead of tripping 429 retries
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "10"))
+
+# Ask for the whole GPT-4 pipeline in one prompt instead of five calls by default
+GPT4_FUSE_CALLS = os.getenv("GPT4_FUSE_CALLS", "").lower() in ("1", "true", "yes")
+
+# OpenAI-compatible local server (vLLM, llama.cpp, Ollama) that answers the job-level
+# context and smart criteria steps when use_gpt4="local"
+LOCAL_LLM_BASE_URL = os.getenv("LOCAL_LLM_BASE_URL", "http://localhost:8080/v1")
+LOCAL_LLM_MODEL = os.getenv("LOCAL_LLM_MODEL", "meta-llama/Meta-Llama-3-8B-Instruct")
+
+BATCH_POLL_INTERVAL_SECONDS = 30.0
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+# Batch input and output files can be large; their transfers get a longer timeout
+BATCH_FILE_TIMEOUT_SECONDS = 300.0
+
+# Job descriptions each calculator memoizes its per-job lookups for (role and company
+# type, required skills); resumes are not memoized since they rarely repeat
+JOB_DESCRIPTION_CACHE_SIZE = 32
+
+# Maximum number of GPT-4 responses kept in the in-memory response cache
+GPT_CACHE_MAX_ENTRIES = 1024
+
+# Optional directory persisting GPT-4 responses across restarts and workers (unset: memory only)
+GPT_CACHE_DIR = os.getenv("GPT_CACHE_DIR")
+
+# Age after which a persisted response is ignored and fetched again
+GPT_CACHE_TTL_SECONDS = float(os.getenv("GPT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Part of every cache key. Bump it when a prompt builder or response parser changes,
+# so responses cached by the previous version are not served.
+GPT_CACHE_VERSION = 1
+
+# Precompiled keyword patterns for per-position scans. Alternatives match as plain
+# substrings (no word boundaries), same as the `any(word in text ...)` checks they replace.
+_LEADERSHIP_RE = re.compile(r"manager|director|lead|head|chief|vp|cto|ceo|principal|staff", re.IGNORECASE)
+_SCOPE_RE = re.compile(r"team|budget|revenue|strategy|architect|cross-functional|stakeholder", re.IGNORECASE)
+_OWNERSHIP_RE = re.compile(r"owned|led|managed|responsible for|delivered|launched|improved", re.IGNORECASE)
+_COMPLEXITY_RE = re.compile(r"scalable|distributed|microservices|architecture|system design|technical leadership", re.IGNORECASE)
+_INTERN_RE = re.compile(r"intern|internship|co-op|coop|part-time|parttime", re.IGNORECASE)
+
+# Ordered (pattern, result) ladders over lowercased text; the first matching pattern wins.
+# Alternatives match as plain substrings, same as the `any(word in text ...)` checks they replace.
+_TITLE_SENIORITY_SCORES = (
+    (re.compile(r"ceo|cto|cfo|vp|director"), 9.0),
+    (re.compile(r"senior|lead|principal"), 7.0),
+    (re.compile(r"manager|supervisor"), 6.0),
+    (re.compile(r"engineer|analyst|developer"), 5.0)
+)
+_ROLE_TYPE_PATTERNS = (
+    (re.compile(r"software|engineer|developer|programmer"), "technical"),
+    (re.compile(r"manager|director|lead"), "management"),
+    (re.compile(r"sales|account|business"), "sales"),
+    (re.compile(r"legal|attorney|law"), "legal"),
+    (re.compile(r"accounting|cpa|audit"), "accounting"),
+    (re.compile(r"healthcare|medical|nurse"), "healthcare")
+)
+_COMPANY_TYPE_PATTERNS = (
+    (re.compile(r"startup|seed|series|early-stage"), "startup"),
+    (re.compile(r"enterprise|fortune|large company"), "enterprise"),
+    (re.compile(r"law firm|legal"), "law_firm"),
+    (re.compile(r"accounting|cpa"), "accounting"),
+    (re.compile(r"healthcare|hospital"), "healthcare")
+)
+# Industry and company type ladders of the fallback context detection
+_CONTEXT_INDUSTRY_PATTERNS = (
+    (re.compile(r"software|engineer|developer|tech"), "tech"),
+    (re.compile(r"healthcare|medical|hospital|clinic"), "healthcare"),
+    (re.compile(r"law|legal|attorney|lawyer"), "law"),
+    (re.compile(r"accounting|cpa|audit|finance"), "finance")
+)
+_CONTEXT_COMPANY_TYPE_PATTERNS = (
+    (re.compile(r"startup|seed|series|early-stage"), "startup"),
+    (re.compile(r"enterprise|fortune|large company"), "enterprise"),
+    (re.compile(r"law firm|llp|amlaw"), "law_firm"),
+    (re.compile(r"accounting firm|big 4"), "accounting"),
+    (re.compile(r"hospital|healthcare system"), "healthcare")
+)
+
+# Precompiled extraction patterns for resume parsing and tenure durations
+_EDUCATION_PATTERNS = (
+    re.compile(r"([A-Z][a-zA-Z\s&]+(?:University|College|Institute|School))", re.IGNORECASE),
+    re.compile(r"(Bachelor|Master|PhD|MBA|MS|BS|BA)\s+(?:of|in)?\s+([A-Za-z\s]+)", re.IGNORECASE)
+)
+_DURATION_RE = re.compile(r'\d{4}-\d{4}|\(\d+\s+years?\)|\(\d+\s+months?\)')
+# Tenure duration formats in order of preference. Each alternative is anchored at the
+# start with a lazy prefix, so an earlier format anywhere in the string wins over a
+# later one, exactly as with one search per format.
+_TENURE_RE = re.compile(
+    r'.*?\((?P<paren_years>\d+(?:\.\d+)?)\s+years?\)'
+    r'|.*?(?P<start_year>\d{4})-(?P<end_year>\d{4})'
+    r'|.*?(?P<years>\d+(?:\.\d+)?)\s+years?'
+    r'|.*?(?P<months>\d+)\s+months?'
+    r'|\s*(?P<number>\d+(?:\.\d+)?)\s*\Z',
+    re.DOTALL
+)
+
+# Line classifiers for work experience extraction (substring matches on lowercased lines)
+_TITLE_HINT_RE = re.compile(r"engineer|manager|director|analyst|developer|consultant|lead|senior|principal|staff")
+_SECTION_HINT_RE = re.compile(r"experience|education|skills|bonus")
+_COMPANY_HINT_RE = re.compile(r"inc|corp|llc|ltd|company|google|microsoft|amazon|apple|meta|ibm|oracle")
+
+# Points per bonus signal found and penalty per red flag found, by category
+_BONUS_SIGNAL_POINTS = {"Exceptional": 5.0, "Strong": 3.0, "Some": 1.0}
+_RED_FLAG_PENALTIES = {"Major": -15.0, "Moderate": -10.0, "Minor": -5.0}
+
+# Collateral weight adjustments: (pattern over lowercased collateral, weight deltas).
+# The first matching rule applies.
+_COLLATERAL_WEIGHT_RULES = (
+    # Startups may value skills and company relevance more
+    (re.compile(r"startup|early-stage"),
+     {"most_important_skills": 0.05, "company_relevance": 0.05, "education": -0.05, "tenure_stability": -0.05}),
+    # Enterprises may value education and stability more
+    (re.compile(r"enterprise|large company"),
+     {"education": 0.05, "tenure_stability": 0.05, "most_important_skills": -0.05, "company_relevance": -0.05}),
+    # Leadership roles may value career trajectory more
+    (re.compile(r"leadership|management"),
+     {"career_trajectory": 0.05, "bonus_signals": 0.02, "most_important_skills": -0.07})
+)
+
+# Weighted components of the final score, in summation order (red flags are added unweighted)
+_WEIGHTED_COMPONENTS = (
+    "education", "career_trajectory", "company_relevance",
+    "tenure_stability", "most_important_skills", "bonus_signals"
+)
+
+# Concern recommendations as (threshold, message), one per score in the order
+# education, career, company, tenure, skills, red flags; a score below its threshold adds the message
+_RECOMMENDATION_RULES = (
+    (6.0, "Education concerns - consider program strength and relevance"),
+    (6.0, "Career trajectory concerns - limited progression visible"),
+    (6.0, "Company relevance concerns - may not fit target environment"),
+    (6.0, "Tenure stability concerns - frequent job changes"),
+    (6.0, "Skills gap - missing critical capabilities"),
+    (-5.0, "Red flags detected - requires careful review")
+)
+
+# Comprehensive technical skills database, shared by required and candidate skill extraction
+_TECH_SKILLS = (
+    # Programming Languages
+    "python", "java", "javascript", "typescript", "go", "rust", "c++", "c#", "php", "ruby", "swift", "kotlin", "scala",
+
+    # Web Technologies
+    "react", "vue", "angular", "node.js", "express", "django", "flask", "spring", "laravel", "asp.net",
+
+    # Cloud & DevOps
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "gitlab", "github", "terraform", "ansible",
+
+    # Databases
+    "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "dynamodb", "cassandra",
+
+    # Data & AI
+    "machine learning", "ai", "data science", "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "spark", "hadoop",
+
+    # Mobile & Desktop
+    "ios", "android", "react native", "flutter", "xamarin", "electron",
+
+    # Other Technologies
+    "graphql", "rest api", "microservices", "serverless", "blockchain", "cybersecurity", "devops", "sre"
+)
+
+# Career trajectory indicators: (position field scanned, pattern, points added to the position score)
+_POSITION_INDICATORS = (
+    ("title", _LEADERSHIP_RE, 2.0),
+    ("description", _SCOPE_RE, 1.5),
+    ("description", _OWNERSHIP_RE, 1.0),
+    ("description", _COMPLEXITY_RE, 1.0)
+)
+
+# Score band tables. Thresholds are ascending lower bounds, so
+# bisect_right(thresholds, value) is the index of the band the value falls in.
+_TENURE_BAND_THRESHOLDS = (0.5, 1.0, 1.5, 2.0, 2.5, 3.0)
+_TENURE_BANDS = (
+    (1.0, "Very short tenures (less than 0.5 years average)", "Very Short (1.0-3.9)"),
+    (4.0, "Frequent job changes (0.5-1 year average)", "Frequent Changes (4.0-5.4)"),
+    (5.5, "Some job hopping (1-1.5 years average)", "Some Hopping (5.5-6.4)"),
+    (6.5, "Reasonable stability (1.5-2 years average)", "Reasonable (6.5-7.4)"),
+    (7.5, "Good stability (2-2.5 years average)", "Good (7.5-8.4)"),
+    (8.5, "Strong stability (2.5-3 years average)", "Strong (8.5-9.4)"),
+    (9.5, "Elite stability (3+ years average)", "Elite (9.5-10.0)")
+)
+_SKILLS_MATCH_THRESHOLDS = (50, 70, 80, 90)
+_SKILLS_MATCH_SCORES = (1.0, 4.0, 6.0, 7.5, 9.0)
+_POSITION_LEVEL_THRESHOLDS = (6.0, 8.0)
+_POSITION_LEVEL_SCORES = (4.0, 6.0, 8.0)
+
+# JSON output schemas shown to the model, shared by the staged and fused prompts
+_CONTEXT_SCHEMA = """{
+    "industry": "detected industry",
+    "company_type": "startup|enterprise|law_firm|accounting|healthcare|consulting|financial|academic|government|non_profit",
+    "role_type": "technical|management|sales|legal|accounting|healthcare|consulting|financial|academic|government|non_profit",
+    "role_level": "entry|mid|senior|executive",
+    "key_requirements": ["requirement1", "requirement2"],
+    "preferences": ["preference1", "preference2"],
+    "company_size": "small|medium|large",
+    "growth_stage": "seed|series_a|series_b|series_c|established|public"
+}"""
+
+_SMART_CRITERIA_SCHEMA = """{
+    "mission_critical_skills": [
+        {
+            "skill": "skill name",
+            "description": "what they must be able to do",
+            "importance": "critical|high|medium"
+        }
+    ],
+    "elite_company_benchmarks": [
+        "company1",
+        "company2"
+    ],
+    "expected_outcomes": [
+        "outcome1",
+        "outcome2"
+    ],
+    "domain_mastery_requirements": [
+        "requirement1",
+        "requirement2"
+    ],
+    "leadership_indicators": [
+        "indicator1",
+        "indicator2"
+    ],
+    "technical_complexity": "low|medium|high",
+    "scale_requirements": "small|medium|large",
+    "industry_specific_requirements": [
+        "requirement1",
+        "requirement2"
+    ]
+}"""
+
+_SKILLS_SCHEMA = """{
+    "candidate_skills": [
+        {
+            "skill": "skill name",
+            "evidence": "where/how it's mentioned",
+            "proficiency": "basic|intermediate|advanced|expert",
+            "years_experience": "estimated years"
+        }
+    ],
+    "required_skills": [
+        {
+            "skill": "skill name",
+            "importance": "required|preferred|nice_to_have",
+            "description": "what they need to do with it"
+        }
+    ],
+    "skill_matches": [
+        {
+            "skill": "skill name",
+            "match_quality": "exact|partial|inferred|missing",
+            "candidate_evidence": "how candidate demonstrates it",
+            "requirement_level": "what job requires"
+        }
+    ],
+    "missing_critical_skills": ["skill1", "skill2"],
+    "inferred_skills": [
+        {
+            "skill": "skill name",
+            "reasoning": "why we can infer this",
+            "confidence": "high|medium|low"
+        }
+    ]
+}"""
+
+_ELITE_EVALUATION_SCHEMA = """{
+    "mission_critical_skills_score": {
+        "score": 0-10,
+        "matches": ["skill1", "skill2"],
+        "gaps": ["skill1", "skill2"],
+        "reasoning": "detailed explanation"
+    },
+    "elite_company_benchmark_score": {
+        "score": 0-10,
+        "company_matches": ["company1", "company2"],
+        "reasoning": "explanation"
+    },
+    "expected_outcomes_score": {
+        "score": 0-10,
+        "outcomes_demonstrated": ["outcome1", "outcome2"],
+        "missing_outcomes": ["outcome1", "outcome2"],
+        "reasoning": "explanation"
+    },
+    "domain_mastery_score": {
+        "score": 0-10,
+        "mastery_areas": ["area1", "area2"],
+        "gaps": ["area1", "area2"],
+        "reasoning": "explanation"
+    },
+    "leadership_score": {
+        "score": 0-10,
+        "leadership_evidence": ["evidence1", "evidence2"],
+        "reasoning": "explanation"
+    },
+    "overall_elite_score": {
+        "score": 0-10,
+        "strengths": ["strength1", "strength2"],
+        "concerns": ["concern1", "concern2"],
+        "recommendation": "submit|reject|consider"
+    }
+}"""
+
+_WEIGHTS_SCHEMA = """{
+    "education": 0.XX,
+    "career_trajectory": 0.XX,
+    "company_relevance": 0.XX,
+    "tenure_stability": 0.XX,
+    "most_important_skills": 0.XX,
+    "bonus_signals": 0.XX,
+    "red_flags": -0.XX,
+    "reasoning": "explanation of adjustments"
+}"""
+
+def _indent_schema(schema: str, indent: int) -> str:
+    """Indent the continuation lines of a schema embedded into an indented prompt line"""
+    return schema.replace("\n", "\n" + " " * indent)
+
+# Fixed instructions and output schema of every GPT-4 step, sent as the system message.
+# The per-call inputs follow in the user message, shared inputs (job description,
+# criteria) before the resume, so repeated calls share the longest possible prefix
+# for OpenAI's automatic prompt caching. Never put per-call values in here.
+GPT4_SYSTEM_PROMPTS = {
+    "context": f"""Analyze the following job description to detect:
+1. Industry (tech, healthcare, law, finance, etc.)
+2. Company type (startup, enterprise, law firm, accounting, healthcare, etc.)
+3. Role type (technical, management, sales, legal, accounting, healthcare, etc.)
+4. Role level (entry, mid, senior, executive)
+5. Key requirements and preferences
+
+Return a JSON object with:
+{_CONTEXT_SCHEMA}""",
+    "smart_criteria": f"""Based on the job description and context, generate elite hiring criteria for top 1-2% performers.
+
+Generate elite criteria in JSON format:
+{_SMART_CRITERIA_SCHEMA}""",
+    "skills": f"""Extract and analyze skills from the resume and job description.
+
+Return JSON with:
+{_SKILLS_SCHEMA}""",
+    "fused": f"""Analyze the job description and resume below in five parts and return all of them in one JSON object.
+1. "context": the industry, company type, role type, role level, and key requirements and preferences of the job
+2. "smart_criteria": elite hiring criteria for top 1-2% performers, consistent with the detected context
+3. "skills": the skills in the resume and job description, how they match, and what is missing
+4. "elite_evaluation": the candidate evaluated against the smart criteria from part 2
+5. "weights": the FitScore scoring weights adjusted for the context and smart criteria
+   (defaults: education 0.20, career_trajectory 0.20, company_relevance 0.15, tenure_stability 0.15,
+   most_important_skills 0.20, bonus_signals 0.05, red_flags -0.15 penalty), considering industry,
+   company type, role level and complexity, growth stage and company size, and specific role
+   requirements; the weights sum to 1.0 excluding the red_flags penalty
+
+Return a JSON object with:
+{{
+    "context": {_indent_schema(_CONTEXT_SCHEMA, 4)},
+    "smart_criteria": {_indent_schema(_SMART_CRITERIA_SCHEMA, 4)},
+    "skills": {_indent_schema(_SKILLS_SCHEMA, 4)},
+    "elite_evaluation": {_indent_schema(_ELITE_EVALUATION_SCHEMA, 4)},
+    "weights": {_indent_schema(_WEIGHTS_SCHEMA, 4)}
+}}""",
+    "bulk": f"""Analyze every numbered candidate below against the job description and the elite hiring criteria.
+For each candidate return one entry in "results" with:
+1. "candidate": the candidate's number
+2. "skills": the skills in the resume and job description, how they match, and what is missing
+3. "elite_evaluation": the candidate evaluated against the elite hiring criteria
+Evaluate each candidate on their own resume only.
+
+Return a JSON object with:
+{{
+    "results": [
+        {{
+            "candidate": 1,
+            "skills": {_indent_schema(_SKILLS_SCHEMA, 12)},
+            "elite_evaluation": {_indent_schema(_ELITE_EVALUATION_SCHEMA, 12)}
+        }}
+    ]
+}}""",
+    "elite_evaluation": f"""Evaluate the candidate against elite hiring criteria.
+
+Return evaluation in JSON:
+{_ELITE_EVALUATION_SCHEMA}""",
+    "weights": f"""Based on the context and smart criteria, adjust the scoring weights for the FitScore evaluation.
+
+Current default weights:
+- Education: 20%
+- Career Trajectory: 20%
+- Company Relevance: 15%
+- Tenure Stability: 15%
+- Most Important Skills: 20%
+- Bonus Signals: 5%
+- Red Flags: -15% (penalty)
+
+Adjust weights based on:
+1. Industry requirements
+2. Company type (startup vs enterprise)
+3. Role level and complexity
+4. Growth stage and company size
+5. Specific role requirements
+
+Return adjusted weights in JSON:
+{_WEIGHTS_SCHEMA}
+
+Ensure weights sum to 1.0 (excluding red_flags penalty)."""
+}
+
+# Structured Outputs response models, mirroring the schemas shown in the system prompts
+class _StrictResponse(BaseModel):
+    # Strict mode requires every object to be closed and every property required
+    model_config = ConfigDict(extra="forbid")
+
+class ContextAnalysis(_StrictResponse):
+    industry: str
+    company_type: Literal[
+        "startup", "enterprise", "law_firm", "accounting", "healthcare", "consulting",
+        "financial", "academic", "government", "non_profit"
+    ]
+    role_type: Literal[
+        "technical", "management", "sales", "legal", "accounting", "healthcare", "consulting",
+        "financial", "academic", "government", "non_profit"
+    ]
+    role_level: Literal["entry", "mid", "senior", "executive"]
+    key_requirements: List[str]
+    preferences: List[str]
+    company_size: Literal["small", "medium", "large"]
+    growth_stage: Literal["seed", "series_a", "series_b", "series_c", "established", "public"]
+
+class MissionCriticalSkill(_StrictResponse):
+    skill: str
+    description: str
+    importance: Literal["critical", "high", "medium"]
+
+class SmartCriteria(_StrictResponse):
+    mission_critical_skills: List[MissionCriticalSkill]
+    elite_company_benchmarks: List[str]
+    expected_outcomes: List[str]
+    domain_mastery_requirements: List[str]
+    leadership_indicators: List[str]
+    technical_complexity: Literal["low", "medium", "high"]
+    scale_requirements: Literal["small", "medium", "large"]
+    industry_specific_requirements: List[str]
+
+class CandidateSkill(_StrictResponse):
+    skill: str
+    evidence: str
+    proficiency: Literal["basic", "intermediate", "advanced", "expert"]
+    years_experience: str
+
+class RequiredSkill(_StrictResponse):
+    skill: str
+    importance: Literal["required", "preferred", "nice_to_have"]
+    description: str
 
-@dataclass
+class SkillMatch(_StrictResponse):
+    skill: str
+    match_quality: Literal["exact", "partial", "inferred", "missing"]
+    candidate_evidence: str
+    requirement_level: str
+
+class InferredSkill(_StrictResponse):
+    skill: str
+    reasoning: str
+    confidence: Literal["high", "medium", "low"]
+
+class SkillsAnalysis(_StrictResponse):
+    candidate_skills: List[CandidateSkill]
+    required_skills: List[RequiredSkill]
+    skill_matches: List[SkillMatch]
+    missing_critical_skills: List[str]
+    inferred_skills: List[InferredSkill]
+
+class MissionCriticalSkillsScore(_StrictResponse):
+    score: float
+    matches: List[str]
+    gaps: List[str]
+    reasoning: str
+
+class EliteCompanyBenchmarkScore(_StrictResponse):
+    score: float
+    company_matches: List[str]
+    reasoning: str
+
+class ExpectedOutcomesScore(_StrictResponse):
+    score: float
+    outcomes_demonstrated: List[str]
+    missing_outcomes: List[str]
+    reasoning: str
+
+class DomainMasteryScore(_StrictResponse):
+    score: float
+    mastery_areas: List[str]
+    gaps: List[str]
+    reasoning: str
+
+class LeadershipScore(_StrictResponse):
+    score: float
+    leadership_evidence: List[str]
+    reasoning: str
+
+class OverallEliteScore(_StrictResponse):
+    score: float
+    strengths: List[str]
+    concerns: List[str]
+    recommendation: Literal["submit", "reject", "consider"]
+
+class EliteEvaluation(_StrictResponse):
+    mission_critical_skills_score: MissionCriticalSkillsScore
+    elite_company_benchmark_score: EliteCompanyBenchmarkScore
+    expected_outcomes_score: ExpectedOutcomesScore
+    domain_mastery_score: DomainMasteryScore
+    leadership_score: LeadershipScore
+    overall_elite_score: OverallEliteScore
+
+class AdjustedWeights(_StrictResponse):
+    education: float
+    career_trajectory: float
+    company_relevance: float
+    tenure_stability: float
+    most_important_skills: float
+    bonus_signals: float
+    red_flags: float
+    reasoning: str
+
+class FusedAnalysis(_StrictResponse):
+    context: ContextAnalysis
+    smart_criteria: SmartCriteria
+    skills: SkillsAnalysis
+    elite_evaluation: EliteEvaluation
+    weights: AdjustedWeights
+
+class BulkCandidateAnalysis(_StrictResponse):
+    candidate: int
+    skills: SkillsAnalysis
+    elite_evaluation: EliteEvaluation
+
+class BulkAnalysis(_StrictResponse):
+    results: List[BulkCandidateAnalysis]
+
+# Structured Outputs: each step's reply is constrained to its response model's JSON schema
+GPT4_RESPONSE_FORMATS = {
+    step: {
+        "type": "json_schema",
+        "json_schema": {"name": step, "schema": model.model_json_schema(), "strict": True}
+    }
+    for step, model in (
+        ("context", ContextAnalysis),
+        ("smart_criteria", SmartCriteria),
+        ("skills", SkillsAnalysis),
+        ("fused", FusedAnalysis),
+        ("bulk", BulkAnalysis),
+        ("elite_evaluation", EliteEvaluation),
+        ("weights", AdjustedWeights)
+    )
+}
+
+def _json_dumps_compact(data: Any) -> str:
+    """Serialize data embedded into a prompt without whitespace, which would only cost tokens"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+def _json_loads(content: str) -> Any:
+    """Parse a GPT-4 JSON response, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+@functools.lru_cache(maxsize=None)
+def _prompt_encoding() -> Optional[Any]:
+    """The GPT-4 model's tiktoken encoding, or None without tiktoken or its BPE file"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(GPT4_MODEL)
+    except Exception as e:
+        logger.warning("tiktoken encoding unavailable, trimming resumes by length: %s", e)
+        return None
+
+def warm_prompt_encoding() -> None:
+    """
+    Load the tiktoken encoding used to trim resumes before the first prompt needs it
+    
+    The first load may download the encoding's BPE file, so servers should run this at
+    startup, off the event loop (asyncio.to_thread), rather than inside a request.
+    """
+    _prompt_encoding()
+
+@functools.lru_cache(maxsize=256)
+def _truncate_resume(resume_text: str) -> str:
+    """
+    Trim a resume to GPT4_MAX_RESUME_TOKENS prompt tokens
+    
+    Memoized so the skills, elite evaluation and fused prompts of one resume share
+    a single tokenization.
+    """
+    encoding = _prompt_encoding()
+    if encoding is None:
+        return resume_text[:GPT4_MAX_RESUME_TOKENS * GPT4_CHARS_PER_TOKEN]
+    # Every token spans at least one byte, so short texts cannot exceed the budget
+    if len(resume_text.encode("utf-8")) <= GPT4_MAX_RESUME_TOKENS:
+        return resume_text
+    tokens = encoding.encode(resume_text)
+    if len(tokens) <= GPT4_MAX_RESUME_TOKENS:
+        return resume_text
+    return encoding.decode(tokens[:GPT4_MAX_RESUME_TOKENS])
+
+@functools.lru_cache(maxsize=4096)
+def _parse_tenure_years(duration: str) -> float:
+    """
+    Calculate tenure in years from duration string with improved parsing
+    
+    Pure function of the duration string, memoized because the same strings
+    ("2 years", "2020-2023 (3 years)") recur across positions and candidates.
+    """
+    if not duration or duration == "Unknown":
+        return 0.0
+    
+    match = _TENURE_RE.match(duration.lower())
+    if not match:
+        return 1.0  # Default to 1 year if can't parse
+    
+    groups = match.groupdict()
+    
+    # Pattern 1: "2021-2024 (3 years)"
+    if groups["paren_years"] is not None:
+        return float(groups["paren_years"])
+    
+    # Pattern 2: "2021-2024" - calculate years
+    if groups["start_year"] is not None:
+        return int(groups["end_year"]) - int(groups["start_year"])
+    
+    # Pattern 3: "3 years" or "2.5 years"
+    if groups["years"] is not None:
+        return float(groups["years"])
+    
+    # Pattern 4: "6 months" - convert to years
+    if groups["months"] is not None:
+        return int(groups["months"]) / 12.0
+    
+    # Pattern 5: Just a number (assume years)
+    return float(groups["number"])
+
+class _KeywordIndex:
+    """
+    Multi-keyword substring matcher built once and reused across calls.
+    
+    Backed by an Aho-Corasick automaton (a single linear pass over the text) when
+    pyahocorasick is installed, otherwise by one substring check per keyword.
+    Keywords are lowercased and callers pass lowercased text. Text that is exactly
+    one of the keywords (a bare company name, say) is answered from a set first.
+    """
+    
+    def __init__(self, keywords: List[str]):
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        self._keyword_set = frozenset(self.keywords)
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def find(self, text_lower: str) -> Set[str]:
+        """Return every keyword occurring anywhere in text_lower"""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text_lower)}
+        return {keyword for keyword in self.keywords if keyword in text_lower}
+    
+    def contains_any(self, text_lower: str) -> bool:
+        """Return True if at least one keyword occurs in text_lower"""
+        if text_lower in self._keyword_set:
+            return True
+        if self._automaton is not None:
+            return next(self._automaton.iter(text_lower), None) is not None
+        return any(keyword in text_lower for keyword in self.keywords)
+
+@dataclass(frozen=True)
 class FitScoreResult:
     """Data class to hold fitscore calculation results"""
+    # Declared by hand because dataclass(slots=True) needs Python 3.10+
+    __slots__ = (
+        "total_score", "education_score", "career_trajectory_score", "company_relevance_score",
+        "tenure_stability_score", "most_important_skills_score", "bonus_signals_score",
+        "red_flags_penalty", "details", "recommendations", "timestamp"
+    )
+    
     total_score: float
     education_score: float
     career_trajectory_score: float
@@ -32,6 +779,46 @@ class FitScoreResult:
     details: Dict[str, Any]
     recommendations: List[str]
     timestamp: str
+    
+    # Frozen slotted instances cannot be restored through setattr, so pickle and copy
+    # get the field values as a tuple and set them back with object.__setattr__
+    # (what dataclass(slots=True) generates on 3.10+)
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+# FitScoreResult field names in declaration order, read in one call by to_dict
+_RESULT_FIELDS = tuple(field.name for field in fields(FitScoreResult))
+_get_result_values = operator.attrgetter(*_RESULT_FIELDS)
+
+def create_openai_http_client() -> httpx.AsyncClient:
+    """
+    Build a connection pool for AsyncOpenAI clients to share
+    
+    Uses HTTP/2 when the h2 package is installed, multiplexing concurrent completions
+    over one TLS connection. Connections belong to the event loop that opened them, so
+    share a pool only between clients used on the same loop.
+    """
+    return httpx.AsyncClient(
+        http2=h2 is not None,
+        limits=httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        timeout=GPT4_TIMEOUT_SECONDS
+    )
+
+def create_openai_client(api_key: str, http_client: Optional[httpx.AsyncClient] = None) -> openai.AsyncOpenAI:
+    """Build an AsyncOpenAI client with the calculator's retry and timeout settings"""
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        max_retries=GPT4_MAX_RETRIES,
+        timeout=GPT4_TIMEOUT_SECONDS,
+        http_client=http_client
+    )
 
 class FitScoreCalculator:
     """
@@ -39,14 +826,61 @@ class FitScoreCalculator:
     with dynamic weights and company/role-specific adjustments.
     """
     
-    def __init__(self, openai_api_key: Optional[str] = None):
-        """Initialize the FitScore calculator"""
-        self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
-        if self.api_key:
-            self.client = openai.OpenAI(api_key=self.api_key)
+    def __init__(
+        self,
+        openai_api_key: Optional[str] = None,
+        gpt_cache_dir: Optional[str] = None,
+        fuse_gpt4_calls: Optional[bool] = None,
+        client: Optional[openai.AsyncOpenAI] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize the FitScore calculator
+        
+        Args:
+            openai_api_key: OpenAI API key (default: OPENAI_API_KEY)
+            gpt_cache_dir: Directory persisting GPT-4 responses (default: GPT_CACHE_DIR, memory only if unset)
+            fuse_gpt4_calls: Answer the whole GPT-4 pipeline with one call (default: GPT4_FUSE_CALLS)
+            client: Ready-made AsyncOpenAI client to use instead of building one from the API key
+            http_client: Connection pool for the clients built here (default: one per client)
+        """
+        self.api_key = client.api_key if client is not None else openai_api_key or os.getenv("OPENAI_API_KEY")
+        if client is not None:
+            self.client = client
+        elif self.api_key:
+            self.client = create_openai_client(self.api_key, http_client)
         else:
             self.client = None
             logger.warning("OpenAI API key not provided. Some features may be limited.")
+        self.local_client = openai.AsyncOpenAI(
+            base_url=LOCAL_LLM_BASE_URL,
+            api_key=os.getenv("LOCAL_LLM_API_KEY", "none"),
+            max_retries=GPT4_MAX_RETRIES,
+            timeout=GPT4_TIMEOUT_SECONDS,
+            http_client=http_client
+        )
+        
+        self.fuse_gpt4_calls = GPT4_FUSE_CALLS if fuse_gpt4_calls is None else fuse_gpt4_calls
+        
+        # Private event loop backing the synchronous calculate_fitscore wrapper
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Semaphores capping in-flight chat completions at OPENAI_MAX_CONCURRENCY, one per
+        # event loop (the sync wrapper's private loop and the caller's loop each get their own)
+        # and API key. Copies made by with_client share this mapping, so every copy using the
+        # same key shares one cap; a key's semaphore is dropped once no call holds it.
+        self._completion_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, weakref.WeakValueDictionary[Optional[str], asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+        
+        # Batch API jobs started with submit_fitscore_batch_async, by batch id: the
+        # resumes and job-level analysis collect_fitscore_batch_async assembles them with
+        self._pending_batches: Dict[str, Tuple[List[str], str, Dict[str, Any], Dict[str, Any], Dict[str, float]]] = {}
+        
+        # GPT-4 responses as JSON text, keyed by a content hash of their inputs (LRU), optionally
+        # backed by one JSON file per response in gpt_cache_dir
+        self._gpt_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.gpt_cache_dir = gpt_cache_dir or GPT_CACHE_DIR
+        if self.gpt_cache_dir:
+            os.makedirs(self.gpt_cache_dir, exist_ok=True)
         
         # Default weights (can be adjusted per company/role)
         self.default_weights = {
@@ -58,6 +892,8 @@ class FitScoreCalculator:
             "bonus_signals": 0.05,
             "red_flags": -0.15  # Penalty
         }
+        # Default weights laid out in _WEIGHTED_COMPONENTS order for the final score
+        self._default_weight_vector = tuple(self.default_weights[k] for k in _WEIGHTED_COMPONENTS)
         
         # Comprehensive elite schools database with specialty recognition
         self.tier1_schools = {
@@ -139,6 +975,90 @@ class FitScoreCalculator:
                 "Massachusetts General", "UCSF Medical Center"
             ]
         }
+        
+        # Bonus signals by category (points per signal found)
+        self.bonus_signals = {
+            "Exceptional": [
+                "patent", "published", "forbes", "founder", "board", "olympic",
+                "military", "ted talk", "book", "award", "media coverage"
+            ],
+            "Strong": [
+                "open source", "speaking", "teaching", "certification",
+                "hackathon", "leadership", "volunteer", "side project"
+            ],
+            "Some": [
+                "portfolio", "community", "course", "competition", "language"
+            ]
+        }
+        
+        # Red flags by severity (penalty per flag found)
+        self.red_flags = {
+            "Major": [
+                "falsified", "plagiarized", "criminal", "ethical violation",
+                "diploma mill", "unaccredited"
+            ],
+            "Moderate": [
+                "job hopping", "employment gap", "no progression",
+                "short tenure", "concerning pattern"
+            ],
+            "Minor": [
+                "overqualified", "location mismatch", "missing certification"
+            ]
+        }
+        
+        # Keyword indexes over the databases above, built once per calculator
+        self._elite_company_index = _KeywordIndex(
+            [company for companies in self.elite_companies.values() for company in companies]
+        )
+        self._elite_company_indexes = {
+            category: _KeywordIndex(companies) for category, companies in self.elite_companies.items()
+        }
+        self._skills_index = _KeywordIndex(list(_TECH_SKILLS))
+        # One index over bonus signals and red flags so a single scan of the resume serves both
+        self._signal_index = _KeywordIndex(
+            [signal for signals in self.bonus_signals.values() for signal in signals] +
+            [flag for flags in self.red_flags.values() for flag in flags]
+        )
+        
+        # Lowercased school lookups, flattened in the order the tier checks apply
+        self._tiered_schools = [
+            (school.lower(), tier, category)
+            for tier, groups in ((1, self.tier1_schools), (2, self.tier2_schools))
+            for category, schools in groups.items()
+            for school in schools
+        ]
+        self._specialty_schools = [
+            (school.lower(), specialty)
+            for specialty, schools in self.specialty_programs.items()
+            for school in schools
+        ]
+        # Keyword indexes over both lists; a school's precedence is its first position above
+        self._tiered_school_index = _KeywordIndex([school_lower for school_lower, _, _ in self._tiered_schools])
+        self._specialty_school_index = _KeywordIndex([school_lower for school_lower, _ in self._specialty_schools])
+        # Every listed school, so an institution naming none is settled with one pass
+        self._school_index = _KeywordIndex(
+            self._tiered_school_index.keywords + self._specialty_school_index.keywords
+        )
+        self._tiered_school_rank: Dict[str, Tuple[int, int, str]] = {}
+        for rank, (school_lower, tier, category) in enumerate(self._tiered_schools):
+            self._tiered_school_rank.setdefault(school_lower, (rank, tier, category))
+        # Exact-name fast path; each entry holds what the ordered scan returns for that name
+        self._school_tier_lookup: Dict[str, Optional[Tuple[int, str]]] = {}
+        for school_lower, _, _ in self._tiered_schools:
+            if school_lower not in self._school_tier_lookup:
+                self._school_tier_lookup[school_lower] = self._scan_tiered_schools(school_lower)
+        
+        # Memoize the pure per-string lookups on this instance; the same schools, titles
+        # and companies recur across the candidates of a batch
+        for method_name in (
+            "_score_institution", "_get_institution_tier", "_is_specialty_match", "_score_job_title",
+            "_score_company_relevance"
+        ):
+            setattr(self, method_name, functools.lru_cache(maxsize=4096)(getattr(self, method_name)))
+        # Lookups keyed by a whole job description: it recurs for every candidate of a job,
+        # but only a few jobs are live at once, so only a few full texts are kept
+        for method_name in ("_detect_role_type", "_detect_company_type", "_match_job_skills"):
+            setattr(self, method_name, functools.lru_cache(maxsize=JOB_DESCRIPTION_CACHE_SIZE)(getattr(self, method_name)))
 
     def calculate_fitscore(
         self, 
@@ -146,80 +1066,444 @@ class FitScoreCalculator:
         job_description: str, 
         collateral: Optional[str] = None,
         company_weights: Optional[Dict[str, float]] = None,
-        use_gpt4: bool = True
+        use_gpt4: Union[bool, str] = True
     ) -> FitScoreResult:
         """
         Calculate comprehensive fitscore using resume and job description with optional GPT-4 enhancement
         
+        Synchronous wrapper around calculate_fitscore_async for scripts and other
+        non-async callers. Code already running inside an event loop (e.g. FastAPI
+        endpoints) should await calculate_fitscore_async directly.
+        
         Args:
             resume_text: Candidate's resume text
             job_description: Job description text
             collateral: Optional additional information (company culture, specific requirements, etc.)
             company_weights: Optional custom weights for company/role
-            use_gpt4: Whether to use GPT-4 for enhanced analysis (default: True)
+            use_gpt4: Whether to use GPT-4 for enhanced analysis (default: True);
+                "local" sends context detection and smart criteria to LOCAL_LLM_BASE_URL
             
         Returns:
             FitScoreResult with detailed scores and analysis
         """
-        logger.info("Starting fitscore calculation with GPT-4 enhancement: %s", use_gpt4)
+        return self._run_sync(self.calculate_fitscore_async(
+            resume_text=resume_text,
+            job_description=job_description,
+            collateral=collateral,
+            company_weights=company_weights,
+            use_gpt4=use_gpt4
+        ))
+
+    def with_client(self, client: openai.AsyncOpenAI) -> "FitScoreCalculator":
+        """
+        Return a calculator that sends OpenAI calls through client and shares everything else
         
-        # Step 1: Context Detection with GPT-4
-        if use_gpt4 and self.client:
-            context = self._detect_context_with_gpt4(job_description, resume_text)
-            logger.info(f"Detected context: {context}")
-        else:
-            context = self._detect_context_fallback(job_description)
+        The copy shares this calculator's lookup indexes, memoized scorers, GPT-4 response
+        cache and pending batches, so it is cheap enough to make per request (for a caller's
+        own API key, say) without rebuilding or replacing a shared calculator.
+        """
+        calculator = copy.copy(self)
+        calculator.api_key = client.api_key
+        calculator.client = client
+        calculator._loop = None
+        return calculator
+
+    def _run_sync(self, coro):
+        """Run a coroutine on the calculator's private event loop.
         
-        # Step 2: Generate Smart Criteria with GPT-4
-        if use_gpt4 and self.client:
-            smart_criteria = self._generate_smart_criteria_with_gpt4(job_description, context)
-            logger.info(f"Generated smart criteria: {smart_criteria}")
-        else:
-            smart_criteria = self._generate_smart_criteria_fallback(job_description, context)
+        The loop is kept alive between calls (rather than using asyncio.run) so the
+        AsyncOpenAI connection pool stays bound to a single, open loop.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    async def calculate_fitscore_async(
+        self, 
+        resume_text: str, 
+        job_description: str, 
+        collateral: Optional[str] = None,
+        company_weights: Optional[Dict[str, float]] = None,
+        use_gpt4: Union[bool, str] = True
+    ) -> FitScoreResult:
+        """
+        Calculate comprehensive fitscore, issuing independent GPT-4 calls concurrently
+        
+        The GPT-4 steps form a small dependency graph: smart criteria need the detected
+        context, weights and elite evaluation need the smart criteria, and skills
+        analysis needs neither. Skills analysis therefore runs alongside the whole
+        context -> criteria -> (weights, elite evaluation) chain, and the two calls
+        at the end of the chain run concurrently with each other.
+        
+        Args:
+            resume_text: Candidate's resume text
+            job_description: Job description text
+            collateral: Optional additional information (company culture, specific requirements, etc.)
+            company_weights: Optional custom weights for company/role
+            use_gpt4: Whether to use GPT-4 for enhanced analysis (default: True);
+                "local" sends context detection and smart criteria to LOCAL_LLM_BASE_URL
+            
+        Returns:
+            FitScoreResult with detailed scores and analysis
+        """
+        logger.info("Starting fitscore calculation with GPT-4 enhancement: %s", use_gpt4)
+        local = use_gpt4 == "local"
+        gpt4_enhanced = bool(use_gpt4) and (self.client is not None or local)
         
-        # Step 3: Dynamic Weight Adjustment with GPT-4
-        if use_gpt4 and self.client:
-            weights = self._adjust_weights_dynamically_with_gpt4(context, smart_criteria)
-            # Remove reasoning from weights dict for calculation
+        if gpt4_enhanced:
+            # The whole pipeline as a single call when fusion is enabled (None if it failed)
+            fused = None
+            if self.fuse_gpt4_calls and self.client and not local:
+                fused = await self._analyze_with_gpt4_fused(resume_text, job_description)
+            
+            if fused:
+                context, smart_criteria, skills_analysis, weights, elite_evaluation = fused
+            else:
+                # Skills analysis needs neither context nor criteria, so it runs alongside the chain
+                (context, smart_criteria, weights, elite_evaluation), skills_analysis = await asyncio.gather(
+                    self._criteria_chain_with_gpt4(resume_text, job_description, local=local),
+                    self._extract_skills_with_gpt4(resume_text, job_description)
+                )
+            logger.info("Enhanced skills analysis completed")
+            
+            # Remove reasoning from weights dict for calculation (copy, the response may be cached)
+            weights = dict(weights)
             weights.pop('reasoning', None)
+            logger.info("Elite evaluation completed")
         else:
+            context = self._detect_context_fallback(job_description)
+            smart_criteria = self._generate_smart_criteria_fallback(job_description, context)
             weights = company_weights or self.default_weights
             if collateral:
                 weights = self._adjust_weights_for_collateral(weights, collateral)
+            skills_analysis = self._extract_skills_fallback(resume_text, job_description)
+            elite_evaluation = self._evaluate_against_smart_criteria_fallback(resume_text, smart_criteria)
+        
+        return self._assemble_result(
+            resume_text, job_description, context, smart_criteria, weights,
+            skills_analysis, elite_evaluation, gpt4_enhanced=gpt4_enhanced
+        )
+
+    def calculate_fitscore_batch(
+        self,
+        resumes: List[str],
+        job_description: str,
+        collateral: Optional[str] = None,
+        company_weights: Optional[Dict[str, float]] = None,
+        use_gpt4: Union[bool, str] = True,
+        use_batch_api: bool = False
+    ) -> List[FitScoreResult]:
+        """
+        Calculate fitscores for many resumes against a single job description
+        
+        Synchronous wrapper around calculate_fitscore_batch_async.
+        
+        Args:
+            resumes: Candidates' resume texts
+            job_description: Job description text
+            collateral: Optional additional information (company culture, specific requirements, etc.)
+            company_weights: Optional custom weights for company/role
+            use_gpt4: Whether to use GPT-4 for enhanced analysis (default: True);
+                "local" sends context detection and smart criteria to LOCAL_LLM_BASE_URL
+            use_batch_api: Send the per-candidate steps through the OpenAI Batch API, which
+                can take up to 24 hours (default: False, score in real time)
+            
+        Returns:
+            List of FitScoreResult, one per resume in input order
+        """
+        return self._run_sync(self.calculate_fitscore_batch_async(
+            resumes=resumes,
+            job_description=job_description,
+            collateral=collateral,
+            company_weights=company_weights,
+            use_gpt4=use_gpt4,
+            use_batch_api=use_batch_api
+        ))
+
+    async def calculate_fitscore_batch_async(
+        self,
+        resumes: List[str],
+        job_description: str,
+        collateral: Optional[str] = None,
+        company_weights: Optional[Dict[str, float]] = None,
+        use_gpt4: Union[bool, str] = True,
+        use_batch_api: bool = False
+    ) -> List[FitScoreResult]:
+        """
+        Calculate fitscores for many resumes against a single job description
+        
+        By default every candidate runs the realtime pipeline concurrently. With
+        use_batch_api=True they are sent through the OpenAI Batch API instead, which
+        is billed at half price and has its own rate limits but can take up to 24
+        hours, and this call waits for it; use submit_fitscore_batch to poll instead.
+        Context, smart criteria and weights depend only on the job description, so
+        they are computed once in real time and the per-candidate skills and elite
+        evaluation prompts go into a single batch.
+        
+        Args:
+            resumes: Candidates' resume texts
+            job_description: Job description text
+            collateral: Optional additional information (company culture, specific requirements, etc.)
+            company_weights: Optional custom weights for company/role
+            use_gpt4: Whether to use GPT-4 for enhanced analysis (default: True);
+                "local" sends context detection and smart criteria to LOCAL_LLM_BASE_URL
+            use_batch_api: Send the per-candidate steps through the OpenAI Batch API, which
+                can take up to 24 hours (default: False, score in real time)
+            
+        Returns:
+            List of FitScoreResult, one per resume in input order
+        """
+        local = use_gpt4 == "local"
+        if use_gpt4 and (self.client or local):
+            # The job-level steps depend only on the job description; run them once up
+            # front so every candidate below is served from the response cache
+            context = await self._detect_context_with_gpt4(job_description, local=local)
+            smart_criteria = await self._generate_smart_criteria_with_gpt4(job_description, context, local=local)
+            weights = await self._adjust_weights_dynamically_with_gpt4(context, smart_criteria)
+        
+        if not (use_batch_api and use_gpt4 and self.client):
+            return list(await asyncio.gather(*(
+                self.calculate_fitscore_async(resume_text, job_description, collateral, company_weights, use_gpt4)
+                for resume_text in resumes
+            )))
+        
+        logger.info("Scoring %d candidates through the OpenAI Batch API", len(resumes))
+        weights = dict(weights)
+        weights.pop('reasoning', None)
+        
+        responses = await self._run_batch_job(self._candidate_batch_requests(resumes, job_description, smart_criteria))
+        return self._assemble_batch_results(resumes, job_description, context, smart_criteria, weights, responses)
+
+    def submit_fitscore_batch(self, resumes: List[str], job_description: str) -> str:
+        """
+        Start scoring resumes through the OpenAI Batch API without waiting for the results
+        
+        Synchronous wrapper around submit_fitscore_batch_async.
+        """
+        return self._run_sync(self.submit_fitscore_batch_async(resumes, job_description))
+
+    async def submit_fitscore_batch_async(self, resumes: List[str], job_description: str) -> str:
+        """
+        Start scoring resumes through the OpenAI Batch API without waiting for the results
+        
+        Context, smart criteria and weights are computed in real time, as in
+        calculate_fitscore_batch_async, and kept in memory with the resumes until the
+        job is collected. Collect with the same calculator instance that submitted it.
+        
+        Args:
+            resumes: Candidates' resume texts
+            job_description: Job description text
+            
+        Returns:
+            The OpenAI batch id to pass to collect_fitscore_batch_async
+        """
+        if not self.client:
+            raise ValueError("OpenAI client not available; the Batch API needs an API key")
+        
+        context = await self._detect_context_with_gpt4(job_description)
+        smart_criteria = await self._generate_smart_criteria_with_gpt4(job_description, context)
+        weights = dict(await self._adjust_weights_dynamically_with_gpt4(context, smart_criteria))
+        weights.pop('reasoning', None)
+        
+        batch_id = await self._submit_batch_job(self._candidate_batch_requests(resumes, job_description, smart_criteria))
+        self._pending_batches[batch_id] = (resumes, job_description, context, smart_criteria, weights)
+        return batch_id
+
+    def collect_fitscore_batch(self, batch_id: str) -> Optional[List[FitScoreResult]]:
+        """
+        Collect the results of a job started with submit_fitscore_batch
+        
+        Synchronous wrapper around collect_fitscore_batch_async.
+        """
+        return self._run_sync(self.collect_fitscore_batch_async(batch_id))
+
+    async def collect_fitscore_batch_async(self, batch_id: str) -> Optional[List[FitScoreResult]]:
+        """
+        Collect the results of a job started with submit_fitscore_batch_async
+        
+        Args:
+            batch_id: Id returned by submit_fitscore_batch_async
+            
+        Returns:
+            None while the batch is still running, otherwise a list of FitScoreResult,
+            one per resume in input order. Raises KeyError for unknown or already collected ids.
+        """
+        resumes, job_description, context, smart_criteria, weights = self._pending_batches[batch_id]
+        responses = await self._collect_batch_job(batch_id)
+        if responses is None:
+            return None
+        
+        self._pending_batches.pop(batch_id, None)
+        return self._assemble_batch_results(resumes, job_description, context, smart_criteria, weights, responses)
+
+    def calculate_fitscore_bulk(
+        self, resumes: List[str], job_description: str, use_gpt4: bool = True
+    ) -> List[FitScoreResult]:
+        """
+        Score many resumes against one job description, several candidates per GPT-4 prompt
+        
+        Synchronous wrapper around calculate_fitscore_bulk_async.
+        """
+        return self._run_sync(self.calculate_fitscore_bulk_async(resumes, job_description, use_gpt4))
+
+    async def calculate_fitscore_bulk_async(
+        self, resumes: List[str], job_description: str, use_gpt4: bool = True
+    ) -> List[FitScoreResult]:
+        """
+        Score many resumes against one job description, several candidates per GPT-4 prompt
+        
+        The job-level steps run once. Skills analysis and elite evaluation for groups of
+        up to GPT4_BULK_MAX_CANDIDATES resumes are then asked for in one prompt each,
+        sharing the job description and criteria, and the groups run concurrently.
+        Candidates a bulk reply leaves out are scored with their own calls.
+        
+        Args:
+            resumes: Candidates' resume texts
+            job_description: Job description text
+            use_gpt4: Whether to use GPT-4 for enhanced analysis (default: True)
+            
+        Returns:
+            List of FitScoreResult, one per resume in input order
+        """
+        if not (use_gpt4 and self.client):
+            return await self.calculate_fitscore_batch_async(
+                resumes, job_description, use_gpt4=use_gpt4, use_batch_api=False
+            )
         
-        # Step 4: Enhanced Skills Analysis with GPT-4
-        if use_gpt4 and self.client:
-            skills_analysis = self._extract_skills_with_gpt4(resume_text, job_description)
-            logger.info(f"Enhanced skills analysis completed")
-        else:
-            skills_analysis = self._extract_skills_fallback(resume_text, job_description)
+        context = await self._detect_context_with_gpt4(job_description)
+        smart_criteria = await self._generate_smart_criteria_with_gpt4(job_description, context)
+        weights = dict(await self._adjust_weights_dynamically_with_gpt4(context, smart_criteria))
+        weights.pop('reasoning', None)
         
-        # Step 5: Elite Evaluation against Smart Criteria with GPT-4
-        if use_gpt4 and self.client:
-            elite_evaluation = self._evaluate_against_smart_criteria_with_gpt4(resume_text, smart_criteria)
-            logger.info(f"Elite evaluation completed")
-        else:
-            elite_evaluation = self._evaluate_against_smart_criteria_fallback(resume_text, smart_criteria)
+        groups = [
+            range(start, min(start + GPT4_BULK_MAX_CANDIDATES, len(resumes)))
+            for start in range(0, len(resumes), GPT4_BULK_MAX_CANDIDATES)
+        ]
+        responses: Dict[str, Dict[str, Any]] = {}
+        for group_responses in await asyncio.gather(*(
+            self._analyze_candidates_with_gpt4(resumes, group, job_description, smart_criteria) for group in groups
+        )):
+            responses.update(group_responses)
+        
+        missing = [i for i in range(len(resumes)) if f"{i}:elite_evaluation" not in responses]
+        if missing:
+            analyses = await asyncio.gather(*(
+                asyncio.gather(
+                    self._extract_skills_with_gpt4(resumes[i], job_description),
+                    self._evaluate_against_smart_criteria_with_gpt4(resumes[i], smart_criteria)
+                )
+                for i in missing
+            ))
+            for i, (skills_analysis, elite_evaluation) in zip(missing, analyses):
+                responses[f"{i}:skills"] = skills_analysis
+                responses[f"{i}:elite_evaluation"] = elite_evaluation
+        
+        return self._assemble_batch_results(resumes, job_description, context, smart_criteria, weights, responses)
+
+    async def _analyze_candidates_with_gpt4(
+        self, resumes: List[str], group: range, job_description: str, smart_criteria: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Ask for skills analysis and elite evaluation of a group of candidates in one GPT-4 call
+        
+        Returns the parts keyed like Batch API responses ("{i}:skills", "{i}:elite_evaluation");
+        candidates missing from the reply are left out.
+        """
+        try:
+            prompt = self._build_bulk_analysis_prompt([resumes[i] for i in group], job_description, smart_criteria)
+            analysis = await self._chat_completion_json("bulk", prompt)
+            entries = analysis["results"]
+        except Exception as e:
+            logger.error("GPT-4 bulk analysis failed, scoring candidates separately: %s", e)
+            return {}
+        
+        responses = {}
+        for entry in entries:
+            number = entry.get("candidate")
+            if not (isinstance(number, int) and 1 <= number <= len(group)):
+                continue
+            if not (isinstance(entry.get("skills"), dict) and isinstance(entry.get("elite_evaluation"), dict)):
+                continue
+            i = group[number - 1]
+            responses[f"{i}:skills"] = entry["skills"]
+            responses[f"{i}:elite_evaluation"] = entry["elite_evaluation"]
+            self._cache_response(self._gpt_cache_key("skills", resumes[i], job_description), entry["skills"])
+            self._cache_response(self._gpt_cache_key("elite_evaluation", resumes[i], smart_criteria), entry["elite_evaluation"])
+        logger.info("GPT-4 bulk analysis completed for %d of %d candidates", len(responses) // 2, len(group))
+        return responses
+
+    def _candidate_batch_requests(
+        self, resumes: List[str], job_description: str, smart_criteria: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Build the Batch API lines for the per-candidate steps, skills analysis and elite evaluation"""
+        candidates = range(len(resumes))
+        return (
+            [self._batch_request(i, "skills", self._build_skills_prompt(resumes[i], job_description)) for i in candidates] +
+            [self._batch_request(i, "elite_evaluation", self._build_elite_evaluation_prompt(resumes[i], smart_criteria)) for i in candidates]
+        )
+
+    def _assemble_batch_results(
+        self,
+        resumes: List[str],
+        job_description: str,
+        context: Dict[str, Any],
+        smart_criteria: Dict[str, Any],
+        weights: Dict[str, float],
+        responses: Dict[str, Dict[str, Any]]
+    ) -> List[FitScoreResult]:
+        """Score every candidate of a Batch API job, falling back per step for missing responses"""
+        # One timestamp for the whole batch
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        results = []
+        for i in range(len(resumes)):
+            skills_analysis = responses.get(f"{i}:skills")
+            elite_evaluation = responses.get(f"{i}:elite_evaluation")
+            # Only candidates whose per-candidate steps both came back count as enhanced
+            gpt4_enhanced = bool(skills_analysis and elite_evaluation)
+            results.append(self._assemble_result(
+                resumes[i], job_description, context, smart_criteria, weights,
+                skills_analysis or self._extract_skills_fallback(resumes[i], job_description),
+                elite_evaluation or self._evaluate_against_smart_criteria_fallback(resumes[i], smart_criteria),
+                gpt4_enhanced=gpt4_enhanced, timestamp=timestamp
+            ))
+        return results
+
+    def _assemble_result(
+        self,
+        resume_text: str,
+        job_description: str,
+        context: Dict[str, Any],
+        smart_criteria: Dict[str, Any],
+        weights: Dict[str, float],
+        skills_analysis: Dict[str, Any],
+        elite_evaluation: Dict[str, Any],
+        gpt4_enhanced: bool,
+        timestamp: Optional[str] = None
+    ) -> FitScoreResult:
+        """Score the resume components and combine them with the GPT-4 (or fallback) analysis"""
+        # Lowercase both texts once, then parse the resume and scan it for bonus signals
+        # and red flags once, sharing the results across the component evaluations
+        resume_lower = resume_text.lower()
+        jd_lower = job_description.lower()
+        parsed_resume = self._parse_resume(resume_text, resume_lower)
+        found_signals = self._signal_index.find(resume_lower)
         
         # Step 6: Traditional Component Evaluation (with GPT-4 enhancements where applicable)
-        education_score, education_details = self._evaluate_education(resume_text, job_description)
-        career_score, career_details = self._evaluate_career_trajectory(resume_text, job_description)
-        company_score, company_details = self._evaluate_company_relevance(resume_text, job_description)
-        tenure_score, tenure_details = self._evaluate_tenure_stability(resume_text, job_description)
-        skills_score, skills_details = self._evaluate_most_important_skills(resume_text, job_description)
-        bonus_score, bonus_details = self._evaluate_bonus_signals(resume_text, job_description)
-        red_flags_penalty, red_flags_details = self._evaluate_red_flags(resume_text, job_description)
+        education_score, education_details = self._evaluate_education(resume_text, job_description, parsed_resume)
+        career_score, career_details = self._evaluate_career_trajectory(resume_text, job_description, parsed_resume)
+        company_score, company_details = self._evaluate_company_relevance(resume_text, job_description, parsed_resume)
+        tenure_score, tenure_details = self._evaluate_tenure_stability(resume_text, job_description, parsed_resume)
+        skills_score, skills_details = self._evaluate_most_important_skills(resume_text, job_description, parsed_resume, jd_lower)
+        bonus_score, bonus_details = self._evaluate_bonus_signals(resume_text, job_description, found_signals)
+        red_flags_penalty, red_flags_details = self._evaluate_red_flags(resume_text, job_description, found_signals)
         
         # Step 7: Calculate weighted final score
-        final_score = (
-            education_score * weights["education"] +
-            career_score * weights["career_trajectory"] +
-            company_score * weights["company_relevance"] +
-            tenure_score * weights["tenure_stability"] +
-            skills_score * weights["most_important_skills"] +
-            bonus_score * weights["bonus_signals"] +
-            red_flags_penalty
-        )
+        if weights is self.default_weights:
+            weight_vector = self._default_weight_vector
+        else:
+            weight_vector = tuple(weights[k] for k in _WEIGHTED_COMPONENTS)
+        component_scores = (education_score, career_score, company_score, tenure_score, skills_score, bonus_score)
+        final_score = sum(map(operator.mul, component_scores, weight_vector)) + red_flags_penalty
         
         # Step 8: Generate enhanced recommendations
         recommendations = self._generate_recommendations(
@@ -241,7 +1525,7 @@ class FitScoreCalculator:
             "smart_criteria": smart_criteria,
             "skills_analysis": skills_analysis,
             "elite_evaluation": elite_evaluation,
-            "gpt4_enhanced": use_gpt4 and self.client is not None
+            "gpt4_enhanced": gpt4_enhanced
         }
         
         return FitScoreResult(
@@ -255,15 +1539,15 @@ class FitScoreCalculator:
             red_flags_penalty=red_flags_penalty,
             details=details,
             recommendations=recommendations,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat(timespec="seconds")
         )
 
-    def _evaluate_education(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _evaluate_education(self, resume_text: str, job_description: str, parsed_resume: Optional[Dict[str, List]] = None) -> Tuple[float, Dict]:
         """Evaluate education based on tier system (20% weight)"""
-        logger.info("Evaluating education")
+        logger.debug("Evaluating education")
         
         # Extract education information
-        education_info = self._extract_education_info(resume_text)
+        education_info = parsed_resume["education"] if parsed_resume else self._extract_education_info(resume_text)
         
         total_score = 0.0
         education_details = {
@@ -304,18 +1588,18 @@ class FitScoreCalculator:
         
         return avg_score, education_details
 
-    def _evaluate_career_trajectory(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _evaluate_career_trajectory(self, resume_text: str, job_description: str, parsed_resume: Optional[Dict[str, List]] = None) -> Tuple[float, Dict]:
         """Evaluate career trajectory and progression using detailed scoring (20% weight)"""
-        logger.info("Evaluating career trajectory")
+        logger.debug("Evaluating career trajectory")
         
         # Extract work experience
-        work_experience = self._extract_work_experience(resume_text)
+        work_experience = parsed_resume["work_experience"] if parsed_resume else self._extract_work_experience(resume_text)
         
         if not work_experience:
             return 1.0, {"error": "No work experience found", "score": 1.0}
         
-        # Sort by date (most recent first)
-        work_experience.sort(key=lambda x: x.get("end_date", "Present"), reverse=True)
+        # Sort by date (most recent first); copy so the shared parsed list keeps resume order
+        work_experience = sorted(work_experience, key=lambda x: x.get("end_date", "Present"), reverse=True)
         
         trajectory_details = {
             "positions": [],
@@ -328,100 +1612,72 @@ class FitScoreCalculator:
             "progression_level": ""
         }
         
-        # Analyze each position for progression indicators
-        position_scores = []
-        total_leadership = 0
-        total_scope = 0
-        total_ownership = 0
-        total_complexity = 0
+        # Indicator flags for every position in one pass; columns follow _POSITION_INDICATORS
+        indicator_rows = [
+            tuple(pattern.search(position.get(field, "")) is not None for field, pattern, _ in _POSITION_INDICATORS)
+            for position in work_experience
+        ]
+        total_leadership, total_scope, total_ownership, total_complexity = map(sum, zip(*indicator_rows))
         
-        for i, position in enumerate(work_experience):
-            title = position["title"]
-            description = position.get("description", "")
-            
-            # Base title score
-            title_score = self._score_job_title(title)
-            
-            # Leadership indicators
-            leadership_score = 0.0
-            if any(word in title.lower() for word in ["manager", "director", "lead", "head", "chief", "vp", "cto", "ceo", "principal", "staff"]):
-                leadership_score = 2.0
-                total_leadership += 1
-            
-            # Scope and responsibility indicators
-            scope_score = 0.0
-            if any(word in description.lower() for word in ["team", "budget", "revenue", "strategy", "architect", "cross-functional", "stakeholder"]):
-                scope_score = 1.5
-                total_scope += 1
-            
-            # Ownership indicators
-            ownership_score = 0.0
-            if any(word in description.lower() for word in ["owned", "led", "managed", "responsible for", "delivered", "launched", "improved"]):
-                ownership_score = 1.0
-                total_ownership += 1
-            
-            # Complexity indicators
-            complexity_score = 0.0
-            if any(word in description.lower() for word in ["scalable", "distributed", "microservices", "architecture", "system design", "technical leadership"]):
-                complexity_score = 1.0
-                total_complexity += 1
-            
-            position_score = title_score + leadership_score + scope_score + ownership_score + complexity_score
+        position_scores: List[float] = []
+        for position, flags in zip(work_experience, indicator_rows):
+            # Base title score plus the points of every indicator present
+            position_score = self._score_job_title(position["title"]) + sum(
+                points for (_, _, points), present in zip(_POSITION_INDICATORS, flags) if present
+            )
             position_scores.append(position_score)
             
+            leadership, scope, ownership, complexity = flags
             trajectory_details["positions"].append({
-                "title": title,
+                "title": position["title"],
                 "company": position["company"],
                 "duration": position.get("duration", ""),
                 "score": position_score,
-                "leadership": leadership_score > 0,
-                "scope": scope_score > 0,
-                "ownership": ownership_score > 0,
-                "complexity": complexity_score > 0
+                "leadership": leadership,
+                "scope": scope,
+                "ownership": ownership,
+                "complexity": complexity
             })
         
-        # Calculate progression metrics
-        avg_position_score = sum(position_scores) / len(position_scores)
-        
         # Analyze progression pattern
         if len(position_scores) >= 3:
-            recent_scores = position_scores[:3]
+            latest, previous, earlier = position_scores[:3]
             
             # Check for exceptional progression (9.5-10.0)
-            if (recent_scores[0] >= 9.0 and recent_scores[1] >= 8.0 and 
+            if (latest >= 9.0 and previous >= 8.0 and 
                 total_leadership >= 2 and total_ownership >= 2):
                 progression_score = 9.5
                 trajectory_details["progression_pattern"] = "Exceptional progression with leadership and ownership"
                 trajectory_details["progression_level"] = "Exceptional (9.5-10.0)"
             
             # Check for clear upward progression (9.0-9.4)
-            elif (recent_scores[0] > recent_scores[1] > recent_scores[2] and 
-                  recent_scores[0] >= 7.5 and total_leadership >= 1):
+            elif (latest > previous > earlier and 
+                  latest >= 7.5 and total_leadership >= 1):
                 progression_score = 9.0
                 trajectory_details["progression_pattern"] = "Clear upward progression with leadership"
                 trajectory_details["progression_level"] = "Clear Upward (9.0-9.4)"
             
             # Check for strong progression (8.0-8.9)
-            elif (recent_scores[0] > recent_scores[2] and 
-                  recent_scores[0] >= 7.0 and total_scope >= 1):
+            elif (latest > earlier and 
+                  latest >= 7.0 and total_scope >= 1):
                 progression_score = 8.0
                 trajectory_details["progression_pattern"] = "Strong progression with scope growth"
                 trajectory_details["progression_level"] = "Strong (8.0-8.9)"
             
             # Check for good progression (7.0-7.9)
-            elif recent_scores[0] >= 6.0 and total_ownership >= 1:
+            elif latest >= 6.0 and total_ownership >= 1:
                 progression_score = 7.0
                 trajectory_details["progression_pattern"] = "Good progression with ownership"
                 trajectory_details["progression_level"] = "Good (7.0-7.9)"
             
             # Check for steady progression (6.0-6.9)
-            elif recent_scores[0] >= 5.0:
+            elif latest >= 5.0:
                 progression_score = 6.0
                 trajectory_details["progression_pattern"] = "Steady progression"
                 trajectory_details["progression_level"] = "Steady (6.0-6.9)"
             
             # Limited progression (4.0-5.9)
-            elif recent_scores[0] >= 4.0:
+            elif latest >= 4.0:
                 progression_score = 4.0
                 trajectory_details["progression_pattern"] = "Limited progression"
                 trajectory_details["progression_level"] = "Limited (4.0-5.9)"
@@ -434,12 +1690,8 @@ class FitScoreCalculator:
         
         else:
             # For candidates with fewer positions, base on current level
-            if avg_position_score >= 8.0:
-                progression_score = 8.0
-            elif avg_position_score >= 6.0:
-                progression_score = 6.0
-            else:
-                progression_score = 4.0
+            avg_position_score = sum(position_scores) / len(position_scores)
+            progression_score = _POSITION_LEVEL_SCORES[bisect.bisect_right(_POSITION_LEVEL_THRESHOLDS, avg_position_score)]
         
         # Update details
         trajectory_details["leadership_roles"] = total_leadership
@@ -450,11 +1702,11 @@ class FitScoreCalculator:
         
         return progression_score, trajectory_details
 
-    def _evaluate_company_relevance(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _evaluate_company_relevance(self, resume_text: str, job_description: str, parsed_resume: Optional[Dict[str, List]] = None) -> Tuple[float, Dict]:
         """Evaluate company relevance based on role type (15% weight)"""
-        logger.info("Evaluating company relevance")
+        logger.debug("Evaluating company relevance")
         
-        work_experience = self._extract_work_experience(resume_text)
+        work_experience = parsed_resume["work_experience"] if parsed_resume else self._extract_work_experience(resume_text)
         role_type = self._detect_role_type(job_description)
         company_type = self._detect_company_type(job_description)
         
@@ -489,11 +1741,11 @@ class FitScoreCalculator:
         
         return avg_relevance, company_details
 
-    def _evaluate_tenure_stability(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _evaluate_tenure_stability(self, resume_text: str, job_description: str, parsed_resume: Optional[Dict[str, List]] = None) -> Tuple[float, Dict]:
         """Evaluate tenure and stability using detailed scoring rules (15% weight)"""
-        logger.info("Evaluating tenure stability")
+        logger.debug("Evaluating tenure stability")
         
-        work_experience = self._extract_work_experience(resume_text)
+        work_experience = parsed_resume["work_experience"] if parsed_resume else self._extract_work_experience(resume_text)
         
         if not work_experience:
             return 1.0, {"error": "No work experience found", "score": 1.0}
@@ -514,17 +1766,11 @@ class FitScoreCalculator:
         internship_count = 0
         elite_company_tenure = 0.0
         
-        # Identify elite companies for tenure bonus
-        elite_companies = []
-        for category, companies in self.elite_companies.items():
-            elite_companies.extend(companies)
-        
         for position in work_experience:
-            title = position["title"].lower()
             company = position["company"]
             
             # CRITICAL: Exclude internships, co-ops, and part-time student work
-            if any(word in title for word in ["intern", "internship", "co-op", "coop", "part-time", "parttime"]):
+            if _INTERN_RE.search(position["title"]):
                 tenure_details["excluded_positions"].append({
                     "position": position["title"],
                     "company": position["company"],
@@ -540,7 +1786,7 @@ class FitScoreCalculator:
                 valid_positions += 1
                 
                 # Check if it's an elite company for tenure bonus
-                is_elite = any(elite_company.lower() in company.lower() for elite_company in elite_companies)
+                is_elite = self._elite_company_index.contains_any(company.lower())
                 if is_elite:
                     elite_company_tenure += tenure_years
                 
@@ -560,34 +1806,9 @@ class FitScoreCalculator:
         tenure_details["elite_company_tenure"] = elite_company_tenure
         
         # Apply detailed tenure scoring with decimals for precision
-        if avg_tenure >= 3.0:
-            stability_score = 9.5
-            tenure_details["tenure_pattern"] = "Elite stability (3+ years average)"
-            tenure_details["tenure_level"] = "Elite (9.5-10.0)"
-        elif avg_tenure >= 2.5:
-            stability_score = 8.5
-            tenure_details["tenure_pattern"] = "Strong stability (2.5-3 years average)"
-            tenure_details["tenure_level"] = "Strong (8.5-9.4)"
-        elif avg_tenure >= 2.0:
-            stability_score = 7.5
-            tenure_details["tenure_pattern"] = "Good stability (2-2.5 years average)"
-            tenure_details["tenure_level"] = "Good (7.5-8.4)"
-        elif avg_tenure >= 1.5:
-            stability_score = 6.5
-            tenure_details["tenure_pattern"] = "Reasonable stability (1.5-2 years average)"
-            tenure_details["tenure_level"] = "Reasonable (6.5-7.4)"
-        elif avg_tenure >= 1.0:
-            stability_score = 5.5
-            tenure_details["tenure_pattern"] = "Some job hopping (1-1.5 years average)"
-            tenure_details["tenure_level"] = "Some Hopping (5.5-6.4)"
-        elif avg_tenure >= 0.5:
-            stability_score = 4.0
-            tenure_details["tenure_pattern"] = "Frequent job changes (0.5-1 year average)"
-            tenure_details["tenure_level"] = "Frequent Changes (4.0-5.4)"
-        else:
-            stability_score = 1.0
-            tenure_details["tenure_pattern"] = "Very short tenures (less than 0.5 years average)"
-            tenure_details["tenure_level"] = "Very Short (1.0-3.9)"
+        stability_score, tenure_pattern, tenure_level = _TENURE_BANDS[bisect.bisect_right(_TENURE_BAND_THRESHOLDS, avg_tenure)]
+        tenure_details["tenure_pattern"] = tenure_pattern
+        tenure_details["tenure_level"] = tenure_level
         
         # Apply elite company tenure bonus
         if elite_company_tenure > 0:
@@ -604,15 +1825,21 @@ class FitScoreCalculator:
         tenure_details["stability_score"] = stability_score
         return stability_score, tenure_details
 
-    def _evaluate_most_important_skills(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _evaluate_most_important_skills(
+        self,
+        resume_text: str,
+        job_description: str,
+        parsed_resume: Optional[Dict[str, List]] = None,
+        jd_lower: Optional[str] = None
+    ) -> Tuple[float, Dict]:
         """Evaluate most important skills match (20% weight)"""
-        logger.info("Evaluating skills match")
+        logger.debug("Evaluating skills match")
         
         # Extract required skills from job description
-        required_skills = self._extract_required_skills(job_description)
+        required_skills = self._extract_required_skills(job_description, jd_lower)
         
         # Extract candidate skills from resume
-        candidate_skills = self._extract_candidate_skills(resume_text)
+        candidate_skills = parsed_resume["skills"] if parsed_resume else self._extract_candidate_skills(resume_text)
         
         skills_details = {
             "required_skills": required_skills,
@@ -626,11 +1853,12 @@ class FitScoreCalculator:
         if not required_skills:
             return 5.0, {"error": "No required skills identified", "score": 5.0}
         
-        matches = []
-        missing = []
+        matches: List[str] = []
+        missing: List[str] = []
         
+        candidate_skill_set = {skill.lower() for skill in candidate_skills}
         for skill in required_skills:
-            if self._skill_matches(skill, candidate_skills):
+            if self._skill_matches(skill, candidate_skill_set):
                 matches.append(skill)
             else:
                 missing.append(skill)
@@ -638,16 +1866,7 @@ class FitScoreCalculator:
         match_percentage = len(matches) / len(required_skills) * 100
         
         # Score based on match percentage
-        if match_percentage >= 90:
-            skills_score = 9.0
-        elif match_percentage >= 80:
-            skills_score = 7.5
-        elif match_percentage >= 70:
-            skills_score = 6.0
-        elif match_percentage >= 50:
-            skills_score = 4.0
-        else:
-            skills_score = 1.0
+        skills_score = _SKILLS_MATCH_SCORES[bisect.bisect_right(_SKILLS_MATCH_THRESHOLDS, match_percentage)]
         
         skills_details["matches"] = matches
         skills_details["missing"] = missing
@@ -656,9 +1875,9 @@ class FitScoreCalculator:
         
         return skills_score, skills_details
 
-    def _evaluate_bonus_signals(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _evaluate_bonus_signals(self, resume_text: str, job_description: str, found_signals: Optional[Set[str]] = None) -> Tuple[float, Dict]:
         """Evaluate bonus signals (5% weight)"""
-        logger.info("Evaluating bonus signals")
+        logger.debug("Evaluating bonus signals")
         
         bonus_details = {
             "signals_found": [],
@@ -667,37 +1886,16 @@ class FitScoreCalculator:
         
         bonus_score = 0.0
         
-        # Check for exceptional signals (5 points)
-        exceptional_signals = [
-            "patent", "published", "forbes", "founder", "board", "olympic",
-            "military", "ted talk", "book", "award", "media coverage"
-        ]
-        
-        for signal in exceptional_signals:
-            if signal in resume_text.lower():
-                bonus_score += 5.0
-                bonus_details["signals_found"].append(f"Exceptional: {signal}")
-        
-        # Check for strong signals (3-4 points)
-        strong_signals = [
-            "open source", "speaking", "teaching", "certification",
-            "hackathon", "leadership", "volunteer", "side project"
-        ]
-        
-        for signal in strong_signals:
-            if signal in resume_text.lower():
-                bonus_score += 3.0
-                bonus_details["signals_found"].append(f"Strong: {signal}")
-        
-        # Check for some signals (1-2 points)
-        some_signals = [
-            "portfolio", "community", "course", "competition", "language"
-        ]
+        # Single scan of the resume for every bonus signal and red flag
+        if found_signals is None:
+            found_signals = self._signal_index.find(resume_text.lower())
         
-        for signal in some_signals:
-            if signal in resume_text.lower():
-                bonus_score += 1.0
-                bonus_details["signals_found"].append(f"Some: {signal}")
+        # Exceptional signals (5 points), strong signals (3-4 points), some signals (1-2 points)
+        for category, signals in self.bonus_signals.items():
+            for signal in signals:
+                if signal in found_signals:
+                    bonus_score += _BONUS_SIGNAL_POINTS[category]
+                    bonus_details["signals_found"].append(f"{category}: {signal}")
         
         # Cap bonus score at 5.0
         final_bonus_score = min(5.0, bonus_score)
@@ -705,9 +1903,9 @@ class FitScoreCalculator:
         
         return final_bonus_score, bonus_details
 
-    def _evaluate_red_flags(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _evaluate_red_flags(self, resume_text: str, job_description: str, found_signals: Optional[Set[str]] = None) -> Tuple[float, Dict]:
         """Evaluate red flags (-15% penalty)"""
-        logger.info("Evaluating red flags")
+        logger.debug("Evaluating red flags")
         
         red_flags_details = {
             "flags_found": [],
@@ -716,37 +1914,15 @@ class FitScoreCalculator:
         
         penalty = 0.0
         
-        # Check for major red flags (-15 points)
-        major_flags = [
-            "falsified", "plagiarized", "criminal", "ethical violation",
-            "diploma mill", "unaccredited"
-        ]
-        
-        for flag in major_flags:
-            if flag in resume_text.lower():
-                penalty -= 15.0
-                red_flags_details["flags_found"].append(f"Major: {flag}")
-        
-        # Check for moderate red flags (-10 points)
-        moderate_flags = [
-            "job hopping", "employment gap", "no progression",
-            "short tenure", "concerning pattern"
-        ]
-        
-        for flag in moderate_flags:
-            if flag in resume_text.lower():
-                penalty -= 10.0
-                red_flags_details["flags_found"].append(f"Moderate: {flag}")
-        
-        # Check for minor red flags (-5 points)
-        minor_flags = [
-            "overqualified", "location mismatch", "missing certification"
-        ]
+        if found_signals is None:
+            found_signals = self._signal_index.find(resume_text.lower())
         
-        for flag in minor_flags:
-            if flag in resume_text.lower():
-                penalty -= 5.0
-                red_flags_details["flags_found"].append(f"Minor: {flag}")
+        # Major red flags (-15 points), moderate red flags (-10 points), minor red flags (-5 points)
+        for severity, flags in self.red_flags.items():
+            for flag in flags:
+                if flag in found_signals:
+                    penalty += _RED_FLAG_PENALTIES[severity]
+                    red_flags_details["flags_found"].append(f"{severity}: {flag}")
         
         red_flags_details["penalty"] = penalty
         return penalty, red_flags_details
@@ -763,48 +1939,37 @@ class FitScoreCalculator:
         red_flags_penalty: float
     ) -> List[str]:
         """Generate recommendations based on scores"""
-        recommendations = []
+        recommendations: List[str] = []
         
         if final_score >= 8.2:
             recommendations.append("SUBMITTABLE CANDIDATE - Recommend to submit")
         else:
             recommendations.append("RECOMMENDED REJECT - Below elite hiring bar")
         
-        if education_score < 6.0:
-            recommendations.append("Education concerns - consider program strength and relevance")
-        
-        if career_score < 6.0:
-            recommendations.append("Career trajectory concerns - limited progression visible")
-        
-        if company_score < 6.0:
-            recommendations.append("Company relevance concerns - may not fit target environment")
-        
-        if tenure_score < 6.0:
-            recommendations.append("Tenure stability concerns - frequent job changes")
-        
-        if skills_score < 6.0:
-            recommendations.append("Skills gap - missing critical capabilities")
-        
-        if red_flags_penalty < -5.0:
-            recommendations.append("Red flags detected - requires careful review")
+        scores = (education_score, career_score, company_score, tenure_score, skills_score, red_flags_penalty)
+        recommendations.extend(
+            message for score, (threshold, message) in zip(scores, _RECOMMENDATION_RULES) if score < threshold
+        )
         
         return recommendations
 
     # Helper methods for data extraction and scoring
     
+    def _parse_resume(self, resume_text: str, resume_lower: Optional[str] = None) -> Dict[str, List]:
+        """Run every resume extractor once; the evaluators share the result"""
+        return {
+            "education": self._extract_education_info(resume_text),
+            "work_experience": self._extract_work_experience(resume_text),
+            "skills": self._extract_candidate_skills(resume_text, resume_lower)
+        }
+
     def _extract_education_info(self, resume_text: str) -> List[Dict]:
         """Extract education information from resume"""
-        education_info = []
-        
-        # Simple regex patterns for education extraction
-        education_patterns = [
-            r"([A-Z][a-zA-Z\s&]+(?:University|College|Institute|School))",
-            r"(Bachelor|Master|PhD|MBA|MS|BS|BA)\s+(?:of|in)?\s+([A-Za-z\s]+)",
-        ]
+        education_info: List[Dict] = []
         
         # Extract basic education info
-        for pattern in education_patterns:
-            matches = re.finditer(pattern, resume_text, re.IGNORECASE)
+        for pattern in _EDUCATION_PATTERNS:
+            matches = pattern.finditer(resume_text)
             for match in matches:
                 education_info.append({
                     "institution": match.group(1) if match.group(1) else "Unknown",
@@ -816,104 +1981,112 @@ class FitScoreCalculator:
 
     def _extract_work_experience(self, resume_text: str) -> List[Dict]:
         """Extract work experience from resume with improved parsing"""
-        work_experience = []
+        work_experience: List[Dict] = []
         
         # Enhanced patterns to extract job information
         # Look for patterns like "Senior Software Engineer\nGoogle Inc.\n2021-2024 (3 years)"
-        lines = resume_text.split('\n')
+        lines: List[str] = [line.strip() for line in resume_text.split('\n')]
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
+        # Classify every line once; the look-ahead window below only reads these flags
+        lines_lower: List[str] = [line.lower() for line in lines]
+        is_title: List[bool] = [_TITLE_HINT_RE.search(line) is not None for line in lines_lower]
+        is_section: List[bool] = [_SECTION_HINT_RE.search(line) is not None for line in lines_lower]
+        is_company: List[bool] = [_COMPANY_HINT_RE.search(line) is not None for line in lines_lower]
+        
+        for i, title in enumerate(lines):
             # Look for job titles
-            if any(title in line.lower() for title in ['engineer', 'manager', 'director', 'analyst', 'developer', 'consultant', 'lead', 'senior', 'principal', 'staff']):
-                title = line
-                company = "Unknown Company"
-                duration = "Unknown"
-                description = ""
-                
-                # Look for company name in next few lines
-                for j in range(i+1, min(i+5, len(lines))):
-                    next_line = lines[j].strip()
-                    if next_line and not any(skip in next_line.lower() for skip in ['experience', 'education', 'skills', 'bonus']):
-                        # Check if it looks like a company name
-                        if any(company_indicator in next_line.lower() for company_indicator in ['inc', 'corp', 'llc', 'ltd', 'company', 'google', 'microsoft', 'amazon', 'apple', 'meta', 'ibm', 'oracle']):
-                            company = next_line
-                            break
-                
-                # Look for duration in the same area
-                for j in range(i+1, min(i+5, len(lines))):
-                    next_line = lines[j].strip()
-                    if re.search(r'\d{4}-\d{4}|\(\d+\s+years?\)|\(\d+\s+months?\)', next_line):
+            if not is_title[i]:
+                continue
+            
+            company = "Unknown Company"
+            duration = "Unknown"
+            company_found = duration_found = description_done = False
+            desc_lines: List[str] = []
+            
+            # Single sweep over the following lines: company name and duration within the
+            # next 4 lines, description bullets within the next 9
+            for j in range(i+1, min(i+10, len(lines))):
+                next_line = lines[j]
+                if j < i+5:
+                    if not company_found and next_line and not is_section[j] and is_company[j]:
+                        company = next_line
+                        company_found = True
+                    if not duration_found and _DURATION_RE.search(next_line):
                         duration = next_line
-                        break
+                        duration_found = True
                 
-                # Collect description from subsequent lines
-                desc_lines = []
-                for j in range(i+1, min(i+10, len(lines))):
-                    next_line = lines[j].strip()
+                if not description_done:
                     if next_line.startswith('-') or next_line.startswith('•'):
                         desc_lines.append(next_line)
-                    elif next_line and not any(skip in next_line.lower() for skip in ['experience', 'education', 'skills', 'bonus']):
-                        break
-                description = ' '.join(desc_lines)
+                    elif next_line and not is_section[j]:
+                        description_done = True
                 
-                work_experience.append({
-                    "title": title,
-                    "company": company,
-                    "duration": duration,
-                    "description": description
-                })
+                if description_done and (j >= i+4 or (company_found and duration_found)):
+                    break
+            
+            work_experience.append({
+                "title": title,
+                "company": company,
+                "duration": duration,
+                "description": ' '.join(desc_lines)
+            })
         
         return work_experience
 
+    def _scan_tiered_schools(self, institution_lower: str) -> Optional[Tuple[int, str]]:
+        """Return (tier, category) of the first tier 1/2 school named in the institution"""
+        found = self._tiered_school_index.find(institution_lower)
+        if not found:
+            return None
+        _, tier, category = min(self._tiered_school_rank[school_lower] for school_lower in found)
+        return tier, category
+
+    def _match_tiered_school(self, institution_lower: str) -> Optional[Tuple[int, str]]:
+        """Look up the tier 1/2 classification of a lowercased institution name"""
+        if institution_lower in self._school_tier_lookup:
+            return self._school_tier_lookup[institution_lower]
+        return self._scan_tiered_schools(institution_lower)
+
     def _score_institution(self, institution: str, degree_type: str, field: str) -> float:
         """Score an educational institution based on comprehensive tier classification"""
         institution_lower = institution.lower()
+        is_graduate = bool(degree_type) and ("master" in degree_type.lower() or "phd" in degree_type.lower())
+        
+        # Most institutions name no listed school at all
+        if not self._school_index.contains_any(institution_lower):
+            return self._score_unlisted_institution(institution_lower, is_graduate)
         
-        # Check Tier 1 schools with specialty recognition
-        for category, schools in self.tier1_schools.items():
-            for school in schools:
-                if school.lower() in institution_lower:
-                    base_score = 9.5
-                    
-                    # Apply specialty program bonuses
-                    if field and self._is_specialty_match(field, category):
-                        base_score = min(10.0, base_score + 0.5)
-                    
-                    # Graduate degree boost
-                    if degree_type and ("master" in degree_type.lower() or "phd" in degree_type.lower()):
-                        base_score = min(10.0, base_score + 0.3)
-                    
-                    return base_score
-        
-        # Check Tier 2 schools
-        for category, schools in self.tier2_schools.items():
-            for school in schools:
-                if school.lower() in institution_lower:
-                    base_score = 7.5
-                    
-                    # Apply specialty program bonuses
-                    if field and self._is_specialty_match(field, category):
-                        base_score = min(8.5, base_score + 0.5)
-                    
-                    # Graduate degree boost
-                    if degree_type and ("master" in degree_type.lower() or "phd" in degree_type.lower()):
-                        base_score = min(8.5, base_score + 0.3)
-                    
-                    return base_score
+        # Check Tier 1 and Tier 2 schools with specialty recognition
+        match = self._match_tiered_school(institution_lower)
+        if match:
+            tier, category = match
+            base_score, max_score = (9.5, 10.0) if tier == 1 else (7.5, 8.5)
+            
+            # Apply specialty program bonuses
+            if field and self._is_specialty_match(field, category):
+                base_score = min(max_score, base_score + 0.5)
+            
+            # Graduate degree boost
+            if is_graduate:
+                base_score = min(max_score, base_score + 0.3)
+            
+            return base_score
         
         # Check specialty programs for non-tier schools
-        for specialty, schools in self.specialty_programs.items():
-            for school in schools:
-                if school.lower() in institution_lower and field and self._is_specialty_match(field, specialty):
+        if field:
+            found = self._specialty_school_index.find(institution_lower)
+            for school_lower, specialty in self._specialty_schools:
+                if school_lower in found and self._is_specialty_match(field, specialty):
                     return 8.0
         
-        # Default scoring for other institutions
+        return self._score_unlisted_institution(institution_lower, is_graduate)
+    
+    def _score_unlisted_institution(self, institution_lower: str, is_graduate: bool) -> float:
+        """Default scoring for institutions outside the tier and specialty lists"""
         if "university" in institution_lower or "college" in institution_lower:
             base_score = 5.0
             # Graduate degree boost for any institution
-            if degree_type and ("master" in degree_type.lower() or "phd" in degree_type.lower()):
+            if is_graduate:
                 base_score = min(6.5, base_score + 0.5)
             return base_score
         else:
@@ -939,24 +2112,20 @@ class FitScoreCalculator:
     def _get_institution_tier(self, institution: str) -> str:
         """Get institution tier classification"""
         institution_lower = institution.lower()
+        if not self._school_index.contains_any(institution_lower):
+            return "Tier 3"
         
-        # Check Tier 1 schools
-        for category, schools in self.tier1_schools.items():
-            for school in schools:
-                if school.lower() in institution_lower:
-                    return f"Tier 1 - {category.replace('_', ' ').title()}"
-        
-        # Check Tier 2 schools
-        for category, schools in self.tier2_schools.items():
-            for school in schools:
-                if school.lower() in institution_lower:
-                    return f"Tier 2 - {category.replace('_', ' ').title()}"
+        # Check Tier 1 and Tier 2 schools
+        match = self._match_tiered_school(institution_lower)
+        if match:
+            tier, category = match
+            return f"Tier {tier} - {category.replace('_', ' ').title()}"
         
         # Check specialty programs
-        for specialty, schools in self.specialty_programs.items():
-            for school in schools:
-                if school.lower() in institution_lower:
-                    return f"Specialty - {specialty.replace('_', ' ').title()}"
+        found = self._specialty_school_index.find(institution_lower)
+        for school_lower, specialty in self._specialty_schools:
+            if school_lower in found:
+                return f"Specialty - {specialty.replace('_', ' ').title()}"
         
         return "Tier 3"
 
@@ -964,52 +2133,28 @@ class FitScoreCalculator:
         """Score job title based on seniority"""
         title_lower = title.lower()
         
-        if any(word in title_lower for word in ["ceo", "cto", "cfo", "vp", "director"]):
-            return 9.0
-        elif any(word in title_lower for word in ["senior", "lead", "principal"]):
-            return 7.0
-        elif any(word in title_lower for word in ["manager", "supervisor"]):
-            return 6.0
-        elif any(word in title_lower for word in ["engineer", "analyst", "developer"]):
-            return 5.0
-        else:
-            return 3.0
+        for pattern, score in _TITLE_SENIORITY_SCORES:
+            if pattern.search(title_lower):
+                return score
+        return 3.0
 
     def _detect_role_type(self, job_description: str) -> str:
         """Detect role type from job description"""
         jd_lower = job_description.lower()
         
-        if any(word in jd_lower for word in ["software", "engineer", "developer", "programmer"]):
-            return "technical"
-        elif any(word in jd_lower for word in ["manager", "director", "lead"]):
-            return "management"
-        elif any(word in jd_lower for word in ["sales", "account", "business"]):
-            return "sales"
-        elif any(word in jd_lower for word in ["legal", "attorney", "law"]):
-            return "legal"
-        elif any(word in jd_lower for word in ["accounting", "cpa", "audit"]):
-            return "accounting"
-        elif any(word in jd_lower for word in ["healthcare", "medical", "nurse"]):
-            return "healthcare"
-        else:
-            return "general"
+        for pattern, role_type in _ROLE_TYPE_PATTERNS:
+            if pattern.search(jd_lower):
+                return role_type
+        return "general"
 
     def _detect_company_type(self, job_description: str) -> str:
         """Detect company type from job description"""
         jd_lower = job_description.lower()
         
-        if any(word in jd_lower for word in ["startup", "seed", "series", "early-stage"]):
-            return "startup"
-        elif any(word in jd_lower for word in ["enterprise", "fortune", "large company"]):
-            return "enterprise"
-        elif any(word in jd_lower for word in ["law firm", "legal"]):
-            return "law_firm"
-        elif any(word in jd_lower for word in ["accounting", "cpa"]):
-            return "accounting"
-        elif any(word in jd_lower for word in ["healthcare", "hospital"]):
-            return "healthcare"
-        else:
-            return "general"
+        for pattern, company_type in _COMPANY_TYPE_PATTERNS:
+            if pattern.search(jd_lower):
+                return company_type
+        return "general"
 
     def _score_company_relevance(self, company: str, role_type: str, company_type: str) -> float:
         """Score company relevance based on role and company type"""
@@ -1017,142 +2162,51 @@ class FitScoreCalculator:
         
         if role_type == "technical":
             if company_type == "startup":
-                for elite_startup in self.elite_companies["TECH_STARTUP_ELITE"]:
-                    if elite_startup.lower() in company_lower:
-                        return 9.0
+                if self._elite_company_indexes["TECH_STARTUP_ELITE"].contains_any(company_lower):
+                    return 9.0
             elif company_type == "enterprise":
-                for elite_enterprise in self.elite_companies["TECH_ENTERPRISE_ELITE"]:
-                    if elite_enterprise.lower() in company_lower:
-                        return 9.0
+                if self._elite_company_indexes["TECH_ENTERPRISE_ELITE"].contains_any(company_lower):
+                    return 9.0
         
         elif role_type == "accounting":
-            for big4 in self.elite_companies["BIG4_ACCOUNTING"]:
-                if big4.lower() in company_lower:
-                    return 9.0
+            if self._elite_company_indexes["BIG4_ACCOUNTING"].contains_any(company_lower):
+                return 9.0
         
         elif role_type == "legal":
-            for elite_law in self.elite_companies["ELITE_LAW_FIRMS"]:
-                if elite_law.lower() in company_lower:
-                    return 9.0
+            if self._elite_company_indexes["ELITE_LAW_FIRMS"].contains_any(company_lower):
+                return 9.0
         
         elif role_type == "healthcare":
-            for elite_healthcare in self.elite_companies["ELITE_HEALTHCARE"]:
-                if elite_healthcare.lower() in company_lower:
-                    return 9.0
+            if self._elite_company_indexes["ELITE_HEALTHCARE"].contains_any(company_lower):
+                return 9.0
         
         # Default score
         return 5.0
 
     def _calculate_tenure_years(self, duration: str) -> float:
         """Calculate tenure in years from duration string with improved parsing"""
-        if not duration or duration == "Unknown":
-            return 0.0
-        
-        duration_lower = duration.lower()
-        
-        # Pattern 1: "2021-2024 (3 years)"
-        years_match = re.search(r'\((\d+(?:\.\d+)?)\s+years?\)', duration_lower)
-        if years_match:
-            return float(years_match.group(1))
-        
-        # Pattern 2: "2021-2024" - calculate years
-        year_range_match = re.search(r'(\d{4})-(\d{4})', duration)
-        if year_range_match:
-            start_year = int(year_range_match.group(1))
-            end_year = int(year_range_match.group(2))
-            return end_year - start_year
-        
-        # Pattern 3: "3 years" or "2.5 years"
-        years_only_match = re.search(r'(\d+(?:\.\d+)?)\s+years?', duration_lower)
-        if years_only_match:
-            return float(years_only_match.group(1))
-        
-        # Pattern 4: "6 months" - convert to years
-        months_match = re.search(r'(\d+)\s+months?', duration_lower)
-        if months_match:
-            months = int(months_match.group(1))
-            return months / 12.0
-        
-        # Pattern 5: Just a number (assume years)
-        number_match = re.search(r'^(\d+(?:\.\d+)?)$', duration.strip())
-        if number_match:
-            return float(number_match.group(1))
-        
-        return 1.0  # Default to 1 year if can't parse
+        return _parse_tenure_years(duration)
+
+    def _extract_skills(self, text_lower: str) -> List[str]:
+        """Return the skills database entries mentioned in lowercased text, in database order"""
+        found = self._skills_index.find(text_lower)
+        return [skill for skill in _TECH_SKILLS if skill in found]
 
-    def _extract_required_skills(self, job_description: str) -> List[str]:
+    def _match_job_skills(self, jd_lower: str) -> Tuple[str, ...]:
+        """Memoized skills scan of a job description; a tuple, so callers cannot alter cached results"""
+        return tuple(self._extract_skills(jd_lower))
+
+    def _extract_required_skills(self, job_description: str, jd_lower: Optional[str] = None) -> List[str]:
         """Extract required skills from job description"""
-        skills = []
-        
-        # Comprehensive technical skills database
-        tech_skills = [
-            # Programming Languages
-            "python", "java", "javascript", "typescript", "go", "rust", "c++", "c#", "php", "ruby", "swift", "kotlin", "scala",
-            
-            # Web Technologies
-            "react", "vue", "angular", "node.js", "express", "django", "flask", "spring", "laravel", "asp.net",
-            
-            # Cloud & DevOps
-            "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "gitlab", "github", "terraform", "ansible",
-            
-            # Databases
-            "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "dynamodb", "cassandra",
-            
-            # Data & AI
-            "machine learning", "ai", "data science", "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "spark", "hadoop",
-            
-            # Mobile & Desktop
-            "ios", "android", "react native", "flutter", "xamarin", "electron",
-            
-            # Other Technologies
-            "graphql", "rest api", "microservices", "serverless", "blockchain", "cybersecurity", "devops", "sre"
-        ]
-        
-        jd_lower = job_description.lower()
-        for skill in tech_skills:
-            if skill in jd_lower:
-                skills.append(skill)
-        
-        return skills
+        return list(self._match_job_skills(jd_lower if jd_lower is not None else job_description.lower()))
 
-    def _extract_candidate_skills(self, resume_text: str) -> List[str]:
+    def _extract_candidate_skills(self, resume_text: str, resume_lower: Optional[str] = None) -> List[str]:
         """Extract candidate skills from resume"""
-        skills = []
-        
-        # Comprehensive technical skills database (same as required skills)
-        tech_skills = [
-            # Programming Languages
-            "python", "java", "javascript", "typescript", "go", "rust", "c++", "c#", "php", "ruby", "swift", "kotlin", "scala",
-            
-            # Web Technologies
-            "react", "vue", "angular", "node.js", "express", "django", "flask", "spring", "laravel", "asp.net",
-            
-            # Cloud & DevOps
-            "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "gitlab", "github", "terraform", "ansible",
-            
-            # Databases
-            "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "dynamodb", "cassandra",
-            
-            # Data & AI
-            "machine learning", "ai", "data science", "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "spark", "hadoop",
-            
-            # Mobile & Desktop
-            "ios", "android", "react native", "flutter", "xamarin", "electron",
-            
-            # Other Technologies
-            "graphql", "rest api", "microservices", "serverless", "blockchain", "cybersecurity", "devops", "sre"
-        ]
-        
-        resume_lower = resume_text.lower()
-        for skill in tech_skills:
-            if skill in resume_lower:
-                skills.append(skill)
-        
-        return skills
+        return self._extract_skills(resume_lower if resume_lower is not None else resume_text.lower())
 
-    def _skill_matches(self, required_skill: str, candidate_skills: List[str]) -> bool:
-        """Check if candidate has required skill"""
-        return required_skill.lower() in [skill.lower() for skill in candidate_skills]
+    def _skill_matches(self, required_skill: str, candidate_skill_set: Set[str]) -> bool:
+        """Check if candidate has required skill (candidate_skill_set holds lowercased names)"""
+        return required_skill.lower() in candidate_skill_set
 
     def _adjust_weights_for_collateral(self, weights: Dict[str, float], collateral: str) -> Dict[str, float]:
         """Adjust weights based on collateral information"""
@@ -1160,174 +2214,387 @@ class FitScoreCalculator:
         collateral_lower = collateral.lower()
         
         # Adjust weights based on collateral content
-        if "startup" in collateral_lower or "early-stage" in collateral_lower:
-            # Startups may value skills and company relevance more
-            adjusted_weights["most_important_skills"] += 0.05
-            adjusted_weights["company_relevance"] += 0.05
-            adjusted_weights["education"] -= 0.05
-            adjusted_weights["tenure_stability"] -= 0.05
-        
-        elif "enterprise" in collateral_lower or "large company" in collateral_lower:
-            # Enterprises may value education and stability more
-            adjusted_weights["education"] += 0.05
-            adjusted_weights["tenure_stability"] += 0.05
-            adjusted_weights["most_important_skills"] -= 0.05
-            adjusted_weights["company_relevance"] -= 0.05
-        
-        elif "leadership" in collateral_lower or "management" in collateral_lower:
-            # Leadership roles may value career trajectory more
-            adjusted_weights["career_trajectory"] += 0.05
-            adjusted_weights["bonus_signals"] += 0.02
-            adjusted_weights["most_important_skills"] -= 0.07
-        
-        # Normalize weights to ensure they sum to 1.0
+        for pattern, deltas in _COLLATERAL_WEIGHT_RULES:
+            if pattern.search(collateral_lower):
+                for key, delta in deltas.items():
+                    adjusted_weights[key] += delta
+                break
+        
+        # Normalize weights by their total (dividing by a total of exactly 1.0 is a no-op,
+        # so no float equality check is needed)
         total_weight = sum(adjusted_weights.values())
-        if total_weight != 1.0:
-            for key in adjusted_weights:
-                if key != "red_flags":  # Don't normalize penalty
-                    adjusted_weights[key] = adjusted_weights[key] / total_weight
+        for key in adjusted_weights:
+            if key != "red_flags":  # Don't normalize penalty
+                adjusted_weights[key] = adjusted_weights[key] / total_weight
         
         return adjusted_weights
 
     def to_dict(self, result: FitScoreResult) -> Dict:
-        """Convert FitScoreResult to dictionary"""
-        return {
-            "total_score": result.total_score,
-            "education_score": result.education_score,
-            "career_trajectory_score": result.career_trajectory_score,
-            "company_relevance_score": result.company_relevance_score,
-            "tenure_stability_score": result.tenure_stability_score,
-            "most_important_skills_score": result.most_important_skills_score,
-            "bonus_signals_score": result.bonus_signals_score,
-            "red_flags_penalty": result.red_flags_penalty,
-            "details": result.details,
-            "recommendations": result.recommendations,
-            "timestamp": result.timestamp,
-            "submittable": result.total_score >= 8.2
-        }
+        """Convert FitScoreResult to dictionary (details and recommendations are shared, not copied)"""
+        result_dict = dict(zip(_RESULT_FIELDS, _get_result_values(result)))
+        result_dict["submittable"] = result.total_score >= 8.2
+        return result_dict
 
     def to_json(self, result: FitScoreResult) -> str:
         """Convert FitScoreResult to JSON string"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(result), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(self.to_dict(result), indent=2)
 
-    def _detect_context_with_gpt4(self, job_description: str, resume_text: str) -> Dict[str, Any]:
-        """
-        Use GPT-4 to intelligently detect context, industry, role type, and company type
+    def to_columns(self, results: List[FitScoreResult]) -> Dict[str, List[Any]]:
         """
-        if not self.client:
-            logger.warning("OpenAI client not available, using fallback context detection")
-            return self._detect_context_fallback(job_description)
+        Convert batch results to column lists (one entry per candidate, in input order)
         
-        try:
-            prompt = f"""
-            Analyze the following job description and resume to detect:
-            1. Industry (tech, healthcare, law, finance, etc.)
-            2. Company type (startup, enterprise, law firm, accounting, healthcare, etc.)
-            3. Role type (technical, management, sales, legal, accounting, healthcare, etc.)
-            4. Role level (entry, mid, senior, executive)
-            5. Key requirements and preferences
+        The flat column layout keeps only the scores and a few headline details, and can be
+        passed straight to pandas.DataFrame or polars.DataFrame for filtering and reporting.
+        """
+        columns: Dict[str, List[Any]] = {
+            "candidate_id": list(range(len(results))),
+            "total_score": [],
+            "education_score": [],
+            "career_trajectory_score": [],
+            "company_relevance_score": [],
+            "tenure_stability_score": [],
+            "most_important_skills_score": [],
+            "bonus_signals_score": [],
+            "red_flags_penalty": [],
+            "submittable": [],
+            "role_type": [],
+            "company_type": [],
+            "average_tenure": [],
+            "match_percentage": [],
+            "timestamp": []
+        }
+        for result in results:
+            context = result.details.get("context_detection", {})
+            columns["total_score"].append(result.total_score)
+            columns["education_score"].append(result.education_score)
+            columns["career_trajectory_score"].append(result.career_trajectory_score)
+            columns["company_relevance_score"].append(result.company_relevance_score)
+            columns["tenure_stability_score"].append(result.tenure_stability_score)
+            columns["most_important_skills_score"].append(result.most_important_skills_score)
+            columns["bonus_signals_score"].append(result.bonus_signals_score)
+            columns["red_flags_penalty"].append(result.red_flags_penalty)
+            columns["submittable"].append(result.total_score >= 8.2)
+            columns["role_type"].append(context.get("role_type"))
+            columns["company_type"].append(context.get("company_type"))
+            columns["average_tenure"].append(result.details.get("tenure_stability", {}).get("average_tenure"))
+            columns["match_percentage"].append(result.details.get("most_important_skills", {}).get("match_percentage"))
+            columns["timestamp"].append(result.timestamp)
+        return columns
+
+    # Prompt builders shared by the realtime and Batch API paths; each builds the user
+    # message that follows the step's GPT4_SYSTEM_PROMPTS entry
+    def _build_context_prompt(self, job_description: str) -> str:
+        """Build the context detection prompt"""
+        return f"""
+            Job Description:
+            {job_description}
+            """
+
+    def _build_smart_criteria_prompt(self, job_description: str, context: Dict[str, Any]) -> str:
+        """Build the smart criteria generation prompt"""
+        return f"""
+            Context: {_json_dumps_compact(context)}
             
+            Job Description:
+            {job_description}
+            """
+
+    def _build_skills_prompt(self, resume_text: str, job_description: str) -> str:
+        """Build the skills extraction prompt"""
+        return f"""
             Job Description:
             {job_description}
             
             Resume:
-            {resume_text}
+            {_truncate_resume(resume_text)}
+            """
+
+    def _build_fused_analysis_prompt(self, resume_text: str, job_description: str) -> str:
+        """Build one prompt covering every GPT-4 step"""
+        return f"""
+            Job Description:
+            {job_description}
             
-            Return a JSON object with:
-            {{
-                "industry": "detected industry",
-                "company_type": "startup|enterprise|law_firm|accounting|healthcare|consulting|financial|academic|government|non_profit",
-                "role_type": "technical|management|sales|legal|accounting|healthcare|consulting|financial|academic|government|non_profit",
-                "role_level": "entry|mid|senior|executive",
-                "key_requirements": ["requirement1", "requirement2"],
-                "preferences": ["preference1", "preference2"],
-                "company_size": "small|medium|large",
-                "growth_stage": "seed|series_a|series_b|series_c|established|public"
-            }}
+            Resume:
+            {_truncate_resume(resume_text)}
             """
+
+    def _build_bulk_analysis_prompt(
+        self, resumes: List[str], job_description: str, smart_criteria: Dict[str, Any]
+    ) -> str:
+        """Build one skills and elite evaluation prompt for a numbered group of candidates"""
+        candidates = "\n".join(
+            f"""
+            ### Candidate {number}
+            {_truncate_resume(resume_text)}
+            """
+            for number, resume_text in enumerate(resumes, 1)
+        )
+        return f"""
+            Job Description:
+            {job_description}
+            
+            Elite Criteria:
+            {_json_dumps_compact(smart_criteria)}
+            {candidates}"""
+
+    def _build_elite_evaluation_prompt(self, resume_text: str, smart_criteria: Dict[str, Any]) -> str:
+        """Build the elite evaluation prompt"""
+        return f"""
+            Elite Criteria:
+            {_json_dumps_compact(smart_criteria)}
             
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
+            Resume:
+            {_truncate_resume(resume_text)}
+            """
+
+    def _build_weights_prompt(self, context: Dict[str, Any], smart_criteria: Dict[str, Any]) -> str:
+        """Build the dynamic weight adjustment prompt"""
+        return f"""
+            Context: {_json_dumps_compact(context)}
+            Smart Criteria: {_json_dumps_compact(smart_criteria)}
+            """
+
+    def _gpt_cache_key(self, step: str, *inputs: Any, model: str = GPT4_MODEL) -> str:
+        """
+        Content hash identifying a GPT-4 step and the inputs its prompt is built from
+        
+        The step's system prompt and response schema are part of the hash, so editing
+        either one stops cached replies to the old prompt from being served.
+        """
+        payload = json.dumps(
+            [GPT_CACHE_VERSION, model, step, GPT4_SYSTEM_PROMPTS[step], GPT4_RESPONSE_FORMATS[step], *inputs],
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a cached GPT-4 response, marking it as recently used
+        
+        Responses are kept as JSON text and parsed on every read, so each caller gets
+        its own dicts: results hand them out in details, and edits there must not
+        reach the cache (the disk layer behaves the same way).
+        """
+        serialized = self._gpt_cache.get(cache_key)
+        if serialized is not None:
+            self._gpt_cache.move_to_end(cache_key)
+            return _json_loads(serialized)
+        
+        if not self.gpt_cache_dir:
+            return None
+        path = os.path.join(self.gpt_cache_dir, f"{cache_key}.json")
+        try:
+            if time.time() - os.path.getmtime(path) > GPT_CACHE_TTL_SECONDS:
+                return None
+            with open(path, encoding="utf-8") as f:
+                serialized = f.read()
+            response = _json_loads(serialized)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable GPT-4 cache entry %s: %s", cache_key, e)
+            return None
+        self._remember_response(cache_key, serialized)
+        return response
+
+    def _cache_response(self, cache_key: str, response: Dict[str, Any]) -> None:
+        """Store a GPT-4 response in memory and, when configured, on disk"""
+        serialized = _json_dumps_compact(response)
+        self._remember_response(cache_key, serialized)
+        if self.gpt_cache_dir:
+            path = os.path.join(self.gpt_cache_dir, f"{cache_key}.json")
+            try:
+                # Write then rename so concurrent readers never see a partial file
+                with open(f"{path}.{os.getpid()}.tmp", "w", encoding="utf-8") as f:
+                    f.write(serialized)
+                os.replace(f"{path}.{os.getpid()}.tmp", path)
+            except OSError as e:
+                logger.warning("Could not persist GPT-4 cache entry %s: %s", cache_key, e)
+
+    def _remember_response(self, cache_key: str, serialized: str) -> None:
+        """Add a response's JSON text to the in-memory LRU, evicting the least recently used entries"""
+        self._gpt_cache[cache_key] = serialized
+        self._gpt_cache.move_to_end(cache_key)
+        while len(self._gpt_cache) > GPT_CACHE_MAX_ENTRIES:
+            self._gpt_cache.popitem(last=False)
+
+    def _batch_request(self, candidate_id: int, step: str, prompt: str) -> Dict[str, Any]:
+        """Build one Batch API JSONL line mirroring the realtime chat completion call"""
+        return {
+            "custom_id": f"{candidate_id}:{step}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": GPT4_MODEL,
+                "messages": self._step_messages(step, prompt),
+                "temperature": 0.1,
+                "seed": GPT4_SEED,
+                "max_tokens": GPT4_MAX_TOKENS[step],
+                "response_format": GPT4_RESPONSE_FORMATS[step]
+            }
+        }
+
+    def _step_messages(self, step: str, prompt: str) -> List[Dict[str, str]]:
+        """Chat messages for a GPT-4 step: its fixed system prompt, then the per-call prompt"""
+        return [
+            {"role": "system", "content": GPT4_SYSTEM_PROMPTS[step]},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def _chat_completion_json(self, step: str, prompt: str, local: bool = False) -> Dict[str, Any]:
+        """
+        Run one JSON-mode chat completion for a GPT-4 step and parse the reply
+        
+        The reply is streamed so its tokens are collected as they are generated; closing
+        the stream on exit also drops the connection if the caller is cancelled midway.
+        """
+        client = self.local_client if local else self.client
+        parts = []
+        # The slot is held across the SDK's retries, so 429 backoff also holds back new calls
+        async with self._completion_semaphore():
+            stream = await client.chat.completions.create(
+                model=LOCAL_LLM_MODEL if local else GPT4_MODEL,
+                messages=self._step_messages(step, prompt),
                 temperature=0.1,
-                max_tokens=1000
+                seed=GPT4_SEED,
+                max_tokens=GPT4_MAX_TOKENS[step],
+                response_format=GPT4_RESPONSE_FORMATS[step],
+                stream=True
             )
+            async with stream:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+        return _json_loads("".join(parts))
+
+    def _completion_semaphore(self) -> asyncio.Semaphore:
+        """The semaphore capping in-flight chat completions for the running event loop and API key"""
+        loop = asyncio.get_running_loop()
+        semaphores = self._completion_semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._completion_semaphores[loop] = weakref.WeakValueDictionary()
+        semaphore = semaphores.get(self.api_key)
+        if semaphore is None:
+            # Each API key has its own rate limits, so its own concurrency cap
+            semaphore = semaphores[self.api_key] = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+        return semaphore
+
+    async def _run_batch_job(self, requests: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Submit chat completion requests through the OpenAI Batch API and wait for them
+        
+        Returns the responses as _collect_batch_job does; any API error yields no
+        responses so callers fall back per candidate.
+        """
+        try:
+            batch_id = await self._submit_batch_job(requests)
+            results = await self._collect_batch_job(batch_id)
+            while results is None:
+                await asyncio.sleep(BATCH_POLL_INTERVAL_SECONDS)
+                results = await self._collect_batch_job(batch_id)
+        except Exception as e:
+            logger.error("OpenAI batch submission failed: %s", e)
+            return {}
+        return results
+
+    async def _submit_batch_job(self, requests: List[Dict[str, Any]]) -> str:
+        """Upload chat completion requests as JSONL and start an OpenAI batch over them"""
+        jsonl = "\n".join(_json_dumps_compact(request) for request in requests)
+        batch_file = await self.client.with_options(timeout=BATCH_FILE_TIMEOUT_SECONDS).files.create(
+            file=("fitscore_batch.jsonl", jsonl.encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted OpenAI batch %s with %d requests", batch.id, len(requests))
+        return batch.id
+
+    async def _collect_batch_job(self, batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Fetch the results of an OpenAI batch, or None while it is still running
+        
+        Returns the parsed JSON content of each successful response keyed by custom_id.
+        Failed or malformed responses are left out so callers fall back per candidate,
+        the same way the realtime helpers do.
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status not in BATCH_TERMINAL_STATUSES:
+            return None
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error("OpenAI batch %s finished with status %s", batch.id, batch.status)
+            return {}
+        
+        output = await self.client.with_options(timeout=BATCH_FILE_TIMEOUT_SECONDS).files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            try:
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+                results[record["custom_id"]] = _json_loads(content)
+            except Exception as e:
+                logger.error("OpenAI batch request %s failed: %s", record.get("custom_id"), e)
+        return results
+
+    async def _detect_context_with_gpt4(self, job_description: str, local: bool = False) -> Dict[str, Any]:
+        """
+        Use GPT-4 (or the local model) to intelligently detect context, industry, role type, and company type
+        """
+        if not (self.local_client if local else self.client):
+            logger.warning("OpenAI client not available, using fallback context detection")
+            return self._detect_context_fallback(job_description)
+        
+        cache_key = self._gpt_cache_key("context", job_description, model=LOCAL_LLM_MODEL if local else GPT4_MODEL)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            prompt = self._build_context_prompt(job_description)
             
-            context_data = json.loads(response.choices[0].message.content)
-            logger.info(f"GPT-4 detected context: {context_data}")
+            context_data = await self._chat_completion_json("context", prompt, local=local)
+            logger.debug("GPT-4 detected context: %s", context_data)
+            self._cache_response(cache_key, context_data)
             return context_data
             
         except Exception as e:
-            logger.error(f"GPT-4 context detection failed: {e}")
+            logger.error("GPT-4 context detection failed: %s", e)
             return self._detect_context_fallback(job_description)
 
-    def _generate_smart_criteria_with_gpt4(self, job_description: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _generate_smart_criteria_with_gpt4(self, job_description: str, context: Dict[str, Any], local: bool = False) -> Dict[str, Any]:
         """
-        Use GPT-4 to generate elite hiring criteria based on job description and context
+        Use GPT-4 (or the local model) to generate elite hiring criteria based on job description and context
         """
-        if not self.client:
+        if not (self.local_client if local else self.client):
             logger.warning("OpenAI client not available, using fallback criteria")
             return self._generate_smart_criteria_fallback(job_description, context)
         
+        cache_key = self._gpt_cache_key("smart_criteria", job_description, context, model=LOCAL_LLM_MODEL if local else GPT4_MODEL)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            prompt = f"""
-            Based on the job description and context, generate elite hiring criteria for top 1-2% performers.
-            
-            Context: {json.dumps(context, indent=2)}
-            
-            Job Description:
-            {job_description}
-            
-            Generate elite criteria in JSON format:
-            {{
-                "mission_critical_skills": [
-                    {{
-                        "skill": "skill name",
-                        "description": "what they must be able to do",
-                        "importance": "critical|high|medium"
-                    }}
-                ],
-                "elite_company_benchmarks": [
-                    "company1",
-                    "company2"
-                ],
-                "expected_outcomes": [
-                    "outcome1",
-                    "outcome2"
-                ],
-                "domain_mastery_requirements": [
-                    "requirement1",
-                    "requirement2"
-                ],
-                "leadership_indicators": [
-                    "indicator1",
-                    "indicator2"
-                ],
-                "technical_complexity": "low|medium|high",
-                "scale_requirements": "small|medium|large",
-                "industry_specific_requirements": [
-                    "requirement1",
-                    "requirement2"
-                ]
-            }}
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=1500
-            )
+            prompt = self._build_smart_criteria_prompt(job_description, context)
             
-            criteria = json.loads(response.choices[0].message.content)
-            logger.info(f"GPT-4 generated smart criteria: {criteria}")
+            criteria = await self._chat_completion_json("smart_criteria", prompt, local=local)
+            logger.debug("GPT-4 generated smart criteria: %s", criteria)
+            self._cache_response(cache_key, criteria)
             return criteria
             
         except Exception as e:
-            logger.error(f"GPT-4 criteria generation failed: {e}")
+            logger.error("GPT-4 criteria generation failed: %s", e)
             return self._generate_smart_criteria_fallback(job_description, context)
 
-    def _extract_skills_with_gpt4(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+    async def _extract_skills_with_gpt4(self, resume_text: str, job_description: str) -> Dict[str, Any]:
         """
         Use GPT-4 to extract and match skills more intelligently
         """
@@ -1335,68 +2602,94 @@ class FitScoreCalculator:
             logger.warning("OpenAI client not available, using fallback skills extraction")
             return self._extract_skills_fallback(resume_text, job_description)
         
+        cache_key = self._gpt_cache_key("skills", resume_text, job_description)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            prompt = f"""
-            Extract and analyze skills from the resume and job description.
-            
-            Resume:
-            {resume_text}
-            
-            Job Description:
-            {job_description}
-            
-            Return JSON with:
-            {{
-                "candidate_skills": [
-                    {{
-                        "skill": "skill name",
-                        "evidence": "where/how it's mentioned",
-                        "proficiency": "basic|intermediate|advanced|expert",
-                        "years_experience": "estimated years"
-                    }}
-                ],
-                "required_skills": [
-                    {{
-                        "skill": "skill name",
-                        "importance": "required|preferred|nice_to_have",
-                        "description": "what they need to do with it"
-                    }}
-                ],
-                "skill_matches": [
-                    {{
-                        "skill": "skill name",
-                        "match_quality": "exact|partial|inferred|missing",
-                        "candidate_evidence": "how candidate demonstrates it",
-                        "requirement_level": "what job requires"
-                    }}
-                ],
-                "missing_critical_skills": ["skill1", "skill2"],
-                "inferred_skills": [
-                    {{
-                        "skill": "skill name",
-                        "reasoning": "why we can infer this",
-                        "confidence": "high|medium|low"
-                    }}
-                ]
-            }}
-            """
+            prompt = self._build_skills_prompt(resume_text, job_description)
             
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=2000
-            )
-            
-            skills_analysis = json.loads(response.choices[0].message.content)
-            logger.info(f"GPT-4 skills analysis completed")
+            skills_analysis = await self._chat_completion_json("skills", prompt)
+            logger.info("GPT-4 skills analysis completed")
+            self._cache_response(cache_key, skills_analysis)
             return skills_analysis
             
         except Exception as e:
-            logger.error(f"GPT-4 skills extraction failed: {e}")
+            logger.error("GPT-4 skills extraction failed: %s", e)
             return self._extract_skills_fallback(resume_text, job_description)
 
-    def _evaluate_against_smart_criteria_with_gpt4(self, resume_text: str, smart_criteria: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_with_gpt4_fused(
+        self, resume_text: str, job_description: str
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, float], Dict[str, Any]]]:
+        """
+        Answer the whole GPT-4 pipeline with one call
+        
+        Returns (context, smart_criteria, skills_analysis, weights, elite_evaluation).
+        Each part is cached under the same key its staged helper uses, so once a job
+        description has been analyzed, later resumes only need the concurrent skills and
+        elite evaluation calls, and a resubmitted resume needs none. Returns None if the
+        call fails or a part is missing; the caller then runs the staged calls.
+        """
+        context_key = self._gpt_cache_key("context", job_description)
+        context = self._get_cached_response(context_key)
+        if context is not None:
+            smart_criteria = self._get_cached_response(self._gpt_cache_key("smart_criteria", job_description, context))
+            if smart_criteria is not None:
+                skills_analysis, (weights, elite_evaluation) = await asyncio.gather(
+                    self._extract_skills_with_gpt4(resume_text, job_description),
+                    self._score_against_criteria_with_gpt4(resume_text, context, smart_criteria)
+                )
+                return context, smart_criteria, skills_analysis, weights, elite_evaluation
+        
+        try:
+            prompt = self._build_fused_analysis_prompt(resume_text, job_description)
+            analysis = await self._chat_completion_json("fused", prompt)
+            parts = tuple(
+                analysis[part] for part in ("context", "smart_criteria", "skills", "weights", "elite_evaluation")
+            )
+            if not all(isinstance(part, dict) for part in parts):
+                raise ValueError("fused response is missing a section")
+        except Exception as e:
+            logger.error("GPT-4 fused analysis failed, using separate calls: %s", e)
+            return None
+        
+        context, smart_criteria, skills_analysis, weights, elite_evaluation = parts
+        self._cache_response(context_key, context)
+        self._cache_response(self._gpt_cache_key("smart_criteria", job_description, context), smart_criteria)
+        self._cache_response(self._gpt_cache_key("skills", resume_text, job_description), skills_analysis)
+        self._cache_response(self._gpt_cache_key("weights", context, smart_criteria), weights)
+        self._cache_response(self._gpt_cache_key("elite_evaluation", resume_text, smart_criteria), elite_evaluation)
+        logger.info("GPT-4 fused analysis completed")
+        return parts
+
+    async def _criteria_chain_with_gpt4(
+        self, resume_text: str, job_description: str, local: bool = False
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, float], Dict[str, Any]]:
+        """Run the context -> smart criteria -> (weights, elite evaluation) chain of GPT-4 calls"""
+        # Stage 1: Context Detection with GPT-4
+        context = await self._detect_context_with_gpt4(job_description, local=local)
+        logger.debug("Detected context: %s", context)
+        
+        # Stage 2: Smart Criteria Generation
+        smart_criteria = await self._generate_smart_criteria_with_gpt4(job_description, context, local=local)
+        logger.debug("Generated smart criteria: %s", smart_criteria)
+        
+        # Stage 3: Dynamic Weight Adjustment and Elite Evaluation (both need smart criteria)
+        weights, elite_evaluation = await self._score_against_criteria_with_gpt4(resume_text, context, smart_criteria)
+        return context, smart_criteria, weights, elite_evaluation
+
+    async def _score_against_criteria_with_gpt4(
+        self, resume_text: str, context: Dict[str, Any], smart_criteria: Dict[str, Any]
+    ) -> Tuple[Dict[str, float], Dict[str, Any]]:
+        """Adjust the weights and evaluate the candidate against the smart criteria concurrently"""
+        weights, elite_evaluation = await asyncio.gather(
+            self._adjust_weights_dynamically_with_gpt4(context, smart_criteria),
+            self._evaluate_against_smart_criteria_with_gpt4(resume_text, smart_criteria)
+        )
+        return weights, elite_evaluation
+
+    async def _evaluate_against_smart_criteria_with_gpt4(self, resume_text: str, smart_criteria: Dict[str, Any]) -> Dict[str, Any]:
         """
         Use GPT-4 to evaluate candidate against elite smart criteria
         """
@@ -1404,71 +2697,24 @@ class FitScoreCalculator:
             logger.warning("OpenAI client not available, using fallback evaluation")
             return self._evaluate_against_smart_criteria_fallback(resume_text, smart_criteria)
         
+        cache_key = self._gpt_cache_key("elite_evaluation", resume_text, smart_criteria)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            prompt = f"""
-            Evaluate the candidate against elite hiring criteria.
-            
-            Resume:
-            {resume_text}
-            
-            Elite Criteria:
-            {json.dumps(smart_criteria, indent=2)}
-            
-            Return evaluation in JSON:
-            {{
-                "mission_critical_skills_score": {{
-                    "score": 0-10,
-                    "matches": ["skill1", "skill2"],
-                    "gaps": ["skill1", "skill2"],
-                    "reasoning": "detailed explanation"
-                }},
-                "elite_company_benchmark_score": {{
-                    "score": 0-10,
-                    "company_matches": ["company1", "company2"],
-                    "reasoning": "explanation"
-                }},
-                "expected_outcomes_score": {{
-                    "score": 0-10,
-                    "outcomes_demonstrated": ["outcome1", "outcome2"],
-                    "missing_outcomes": ["outcome1", "outcome2"],
-                    "reasoning": "explanation"
-                }},
-                "domain_mastery_score": {{
-                    "score": 0-10,
-                    "mastery_areas": ["area1", "area2"],
-                    "gaps": ["area1", "area2"],
-                    "reasoning": "explanation"
-                }},
-                "leadership_score": {{
-                    "score": 0-10,
-                    "leadership_evidence": ["evidence1", "evidence2"],
-                    "reasoning": "explanation"
-                }},
-                "overall_elite_score": {{
-                    "score": 0-10,
-                    "strengths": ["strength1", "strength2"],
-                    "concerns": ["concern1", "concern2"],
-                    "recommendation": "submit|reject|consider"
-                }}
-            }}
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=2000
-            )
+            prompt = self._build_elite_evaluation_prompt(resume_text, smart_criteria)
             
-            evaluation = json.loads(response.choices[0].message.content)
-            logger.info(f"GPT-4 elite evaluation completed")
+            evaluation = await self._chat_completion_json("elite_evaluation", prompt)
+            self._cache_response(cache_key, evaluation)
+            logger.info("GPT-4 elite evaluation completed")
             return evaluation
             
         except Exception as e:
-            logger.error(f"GPT-4 elite evaluation failed: {e}")
+            logger.error("GPT-4 elite evaluation failed: %s", e)
             return self._evaluate_against_smart_criteria_fallback(resume_text, smart_criteria)
 
-    def _adjust_weights_dynamically_with_gpt4(self, context: Dict[str, Any], smart_criteria: Dict[str, Any]) -> Dict[str, float]:
+    async def _adjust_weights_dynamically_with_gpt4(self, context: Dict[str, Any], smart_criteria: Dict[str, Any]) -> Dict[str, float]:
         """
         Use GPT-4 to dynamically adjust weights based on context and smart criteria
         """
@@ -1476,57 +2722,21 @@ class FitScoreCalculator:
             logger.warning("OpenAI client not available, using fallback weight adjustment")
             return self._adjust_weights_for_collateral(self.default_weights, "")
         
+        cache_key = self._gpt_cache_key("weights", context, smart_criteria)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            prompt = f"""
-            Based on the context and smart criteria, adjust the scoring weights for the FitScore evaluation.
-            
-            Context: {json.dumps(context, indent=2)}
-            Smart Criteria: {json.dumps(smart_criteria, indent=2)}
-            
-            Current default weights:
-            - Education: 20%
-            - Career Trajectory: 20%
-            - Company Relevance: 15%
-            - Tenure Stability: 15%
-            - Most Important Skills: 20%
-            - Bonus Signals: 5%
-            - Red Flags: -15% (penalty)
-            
-            Adjust weights based on:
-            1. Industry requirements
-            2. Company type (startup vs enterprise)
-            3. Role level and complexity
-            4. Growth stage and company size
-            5. Specific role requirements
+            prompt = self._build_weights_prompt(context, smart_criteria)
             
-            Return adjusted weights in JSON:
-            {{
-                "education": 0.XX,
-                "career_trajectory": 0.XX,
-                "company_relevance": 0.XX,
-                "tenure_stability": 0.XX,
-                "most_important_skills": 0.XX,
-                "bonus_signals": 0.XX,
-                "red_flags": -0.XX,
-                "reasoning": "explanation of adjustments"
-            }}
-            
-            Ensure weights sum to 1.0 (excluding red_flags penalty).
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=1000
-            )
-            
-            adjusted_weights = json.loads(response.choices[0].message.content)
-            logger.info(f"GPT-4 adjusted weights: {adjusted_weights}")
+            adjusted_weights = await self._chat_completion_json("weights", prompt)
+            logger.debug("GPT-4 adjusted weights: %s", adjusted_weights)
+            self._cache_response(cache_key, adjusted_weights)
             return adjusted_weights
             
         except Exception as e:
-            logger.error(f"GPT-4 weight adjustment failed: {e}")
+            logger.error("GPT-4 weight adjustment failed: %s", e)
             return self._adjust_weights_for_collateral(self.default_weights, "")
 
     # Fallback methods for when GPT-4 is not available
@@ -1534,29 +2744,13 @@ class FitScoreCalculator:
         """Fallback context detection using pattern matching"""
         jd_lower = job_description.lower()
         
-        # Detect industry
-        industry = "general"
-        if any(word in jd_lower for word in ["software", "engineer", "developer", "tech"]):
-            industry = "tech"
-        elif any(word in jd_lower for word in ["healthcare", "medical", "hospital", "clinic"]):
-            industry = "healthcare"
-        elif any(word in jd_lower for word in ["law", "legal", "attorney", "lawyer"]):
-            industry = "law"
-        elif any(word in jd_lower for word in ["accounting", "cpa", "audit", "finance"]):
-            industry = "finance"
-        
-        # Detect company type
-        company_type = "general"
-        if any(word in jd_lower for word in ["startup", "seed", "series", "early-stage"]):
-            company_type = "startup"
-        elif any(word in jd_lower for word in ["enterprise", "fortune", "large company"]):
-            company_type = "enterprise"
-        elif any(word in jd_lower for word in ["law firm", "llp", "amlaw"]):
-            company_type = "law_firm"
-        elif any(word in jd_lower for word in ["accounting firm", "big 4"]):
-            company_type = "accounting"
-        elif any(word in jd_lower for word in ["hospital", "healthcare system"]):
-            company_type = "healthcare"
+        # Detect industry and company type
+        industry = next(
+            (label for pattern, label in _CONTEXT_INDUSTRY_PATTERNS if pattern.search(jd_lower)), "general"
+        )
+        company_type = next(
+            (label for pattern, label in _CONTEXT_COMPANY_TYPE_PATTERNS if pattern.search(jd_lower)), "general"
+        )
         
         return {
             "industry": industry,
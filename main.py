@@ -1,27 +1,69 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Form, File, UploadFile
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
 import uvicorn
+import asyncio
 import json
+import logging
 import os
-from typing import Optional
+from typing import Dict, List, Literal, Optional, Union
 from pydantic import BaseModel
-from fitscore_calculator import FitScoreCalculator, FitScoreResult
+from fitscore_calculator import (
+    FitScoreCalculator, FitScoreResult, create_openai_client, create_openai_http_client, warm_prompt_encoding
+)
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm per-process state once the app is served, before its first request"""
+    # Loading the tokenizer may download its BPE file; keep that off the event loop
+    await asyncio.to_thread(warm_prompt_encoding)
+    # Build the OpenAPI schema now instead of on the first /docs or /openapi.json request;
+    # a schema error is logged and left to surface on /docs rather than stopping the app
+    try:
+        app.openapi()
+    except Exception as e:
+        logger.warning("Could not build the OpenAPI schema at startup: %s", e)
+    yield
 
 # Initialize FastAPI app
 app = FastAPI(
     title="FitScore Calculator API",
     description="A comprehensive candidate evaluation system with GPT-4o-mini integration",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Initialize the FitScore calculator
-calculator = FitScoreCalculator()
+# One OpenAI connection pool for every client this process builds, so requests reuse
+# warm TLS connections instead of each client opening its own
+openai_http_client = create_openai_http_client()
+
+# Initialize the FitScore calculator, shared by every request
+calculator = FitScoreCalculator(http_client=openai_http_client)
+
+def request_calculator(openai_api_key: Optional[str]) -> FitScoreCalculator:
+    """
+    Calculator for one request: a caller-supplied API key gets its own client on a
+    per-request copy on the shared connection pool, and the shared calculator (and its
+    caches) is never replaced
+    """
+    if not openai_api_key:
+        return calculator
+    return calculator.with_client(create_openai_client(openai_api_key, openai_http_client))
+
+# Calculators that submitted pending Batch API jobs, by batch id: a batch can only be
+# fetched with the API key (client) that created it
+batch_calculators: Dict[str, FitScoreCalculator] = {}
 
 # Create templates directory and mount static files
 templates = Jinja2Templates(directory="templates")
+# Templates only change on deploy: compile the home page once instead of looking it up per request
+templates.env.auto_reload = False
+INDEX_TEMPLATE = templates.get_template("index.html")
 
 # Pydantic models for request/response
 class FitScoreRequest(BaseModel):
@@ -29,7 +71,7 @@ class FitScoreRequest(BaseModel):
     job_description: str
     collateral: Optional[str] = None
     openai_api_key: Optional[str] = None
-    use_gpt4: bool = True
+    use_gpt4: Union[bool, Literal["local"]] = True
 
 class FitScoreResponse(BaseModel):
     total_score: float
@@ -45,26 +87,35 @@ class FitScoreResponse(BaseModel):
     details: dict
     timestamp: str
 
+class BulkResume(BaseModel):
+    id: str
+    text: str
+
+class BulkFitScoreRequest(BaseModel):
+    job_description: str
+    resumes: List[BulkResume]
+    openai_api_key: Optional[str] = None
+    use_gpt4: bool = True
+
+class BatchSubmitRequest(BaseModel):
+    resumes: List[str]
+    job_description: str
+    openai_api_key: Optional[str] = None
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Home page with form for testing FitScore calculator"""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(INDEX_TEMPLATE.render(request=request))
 
 @app.post("/calculate-fitscore", response_model=FitScoreResponse)
 async def calculate_fitscore(request: FitScoreRequest):
     """
     Calculate FitScore for a candidate based on resume and job description
     """
+    scorer = request_calculator(request.openai_api_key)
     try:
-        # Set OpenAI API key if provided
-        if request.openai_api_key:
-            os.environ["OPENAI_API_KEY"] = request.openai_api_key
-            # Reinitialize calculator with new API key
-            global calculator
-            calculator = FitScoreCalculator(openai_api_key=request.openai_api_key)
-        
         # Calculate FitScore
-        result = calculator.calculate_fitscore(
+        result = await scorer.calculate_fitscore_async(
             resume_text=request.resume_text,
             job_description=request.job_description,
             collateral=request.collateral,
@@ -92,6 +143,29 @@ async def calculate_fitscore(request: FitScoreRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating FitScore: {str(e)}")
 
+@app.post("/calculate-fitscore/bulk")
+async def calculate_fitscore_bulk(request: BulkFitScoreRequest):
+    """
+    Calculate FitScores for many resumes against one job description, several candidates per GPT-4 prompt
+    """
+    scorer = request_calculator(request.openai_api_key)
+    try:
+        results = await scorer.calculate_fitscore_bulk_async(
+            resumes=[resume.text for resume in request.resumes],
+            job_description=request.job_description,
+            use_gpt4=request.use_gpt4
+        )
+        
+        return {
+            "results": [
+                {"id": resume.id, **scorer.to_dict(result)}
+                for resume, result in zip(request.resumes, results)
+            ]
+        }
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error calculating FitScores: {str(e)}")
+
 @app.post("/calculate-fitscore-form")
 async def calculate_fitscore_form(
     resume_text: str = Form(...),
@@ -103,18 +177,13 @@ async def calculate_fitscore_form(
     """
     Calculate FitScore using form data (for web interface)
     """
+    scorer = request_calculator(openai_api_key)
     try:
-        # Set OpenAI API key if provided
-        if openai_api_key:
-            os.environ["OPENAI_API_KEY"] = openai_api_key
-            global calculator
-            calculator = FitScoreCalculator(openai_api_key=openai_api_key)
-        
-        # Convert checkbox value to boolean
-        use_gpt4_bool = use_gpt4 == "on"
+        # Convert checkbox value to boolean ("local" selects the local model route)
+        use_gpt4_bool = "local" if use_gpt4 == "local" else use_gpt4 == "on"
         
         # Calculate FitScore
-        result = calculator.calculate_fitscore(
+        result = await scorer.calculate_fitscore_async(
             resume_text=resume_text,
             job_description=job_description,
             collateral=collateral,
@@ -144,6 +213,47 @@ async def calculate_fitscore_form(
             "error": str(e)
         }
 
+@app.post("/batch/submit")
+async def submit_batch(request: BatchSubmitRequest):
+    """
+    Submit resumes for scoring against one job description through the OpenAI Batch API
+    """
+    scorer = request_calculator(request.openai_api_key)
+    try:
+        batch_id = await scorer.submit_fitscore_batch_async(request.resumes, request.job_description)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error submitting batch: {str(e)}")
+    
+    batch_calculators[batch_id] = scorer
+    return {"batch_id": batch_id, "status": "submitted"}
+
+@app.get("/batch/{batch_id}")
+async def get_batch(batch_id: str):
+    """
+    Poll a submitted batch; results are returned once the OpenAI batch has finished
+    """
+    scorer = batch_calculators.get(batch_id)
+    if scorer is None:
+        raise HTTPException(status_code=404, detail=f"Unknown batch: {batch_id}")
+    try:
+        results = await scorer.collect_fitscore_batch_async(batch_id)
+    except KeyError:
+        batch_calculators.pop(batch_id, None)
+        raise HTTPException(status_code=404, detail=f"Unknown batch: {batch_id}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error collecting batch: {str(e)}")
+    
+    if results is None:
+        return {"batch_id": batch_id, "status": "in_progress"}
+    batch_calculators.pop(batch_id, None)
+    return {
+        "batch_id": batch_id,
+        "status": "completed",
+        "results": [scorer.to_dict(result) for result in results]
+    }
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -155,7 +265,10 @@ async def api_docs():
     return {
         "endpoints": {
             "POST /calculate-fitscore": "Calculate FitScore with JSON payload",
+            "POST /calculate-fitscore/bulk": "Calculate FitScores for many resumes against one job description",
             "POST /calculate-fitscore-form": "Calculate FitScore with form data",
+            "POST /batch/submit": "Submit resumes for Batch API scoring against one job description",
+            "GET /batch/{batch_id}": "Poll a submitted batch and fetch its results",
             "GET /": "Web interface for testing",
             "GET /health": "Health check",
             "GET /api-docs": "This documentation"
@@ -171,7 +284,10 @@ async def api_docs():
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Each worker process imports this module and builds its own calculator. Batch API
+    # jobs stay with the worker that submitted them, so /batch polling needs one worker.
+    # uvicorn[standard] picks its uvloop event loop and httptools parser automatically.
+    uvicorn.run("main:app", host="0.0.0.0", port=port, workers=int(os.environ.get("WEB_CONCURRENCY", 1)))
 
 # For Vercel deployment
 app.debug = True 
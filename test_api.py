@@ -3,19 +3,27 @@
 Test script for the FitScore Calculator FastAPI application
 """
 
-import requests
-import json
+import httpx
 import time
-import subprocess
+import threading
 import os
-import signal
 import sys
+import uvicorn
 
 # API base URL
-BASE_URL = "http://localhost:8000"
+BASE_URL = "http://127.0.0.1:8000"
+
+# ASGI app under test, as "module:attribute" (same variable as conftest.py)
+APP_SPEC = os.environ.get("FITSCORE_APP", "main:app")
+
+# Decode and print response bodies that pass/fail does not need (FITSCORE_TEST_VERBOSE=1)
+VERBOSE = os.environ.get("FITSCORE_TEST_VERBOSE") == "1"
+
+# One keep-alive client for every request, so probes reuse a single connection
+CLIENT = httpx.Client()
 
 def start_server():
-    """Start the FastAPI server in the background"""
+    """Start the FastAPI server in a background thread"""
     print("🚀 Starting FastAPI server...")
     try:
         # Check if main.py exists
@@ -23,72 +31,57 @@ def start_server():
             print("❌ main.py not found!")
             return None
         
-        # Start the server in the background with more verbose output
-        process = subprocess.Popen([
-            sys.executable, "-m", "uvicorn", 
-            "main:app", 
-            "--host", "0.0.0.0", 
-            "--port", "8000",
-            "--log-level", "info"
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Serve the app in-process: no interpreter start-up and no /health polling
+        server = uvicorn.Server(uvicorn.Config(APP_SPEC, host="127.0.0.1", port=8000, log_level="warning", access_log=False))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
         
-        print(f"✅ Server process started with PID: {process.pid}")
-        
-        # Wait longer for server to start
+        # uvicorn sets server.started once the socket is bound and startup has run
         print("⏳ Waiting for server to start...")
-        for i in range(10):  # Wait up to 10 seconds
-            time.sleep(1)
-            try:
-                response = requests.get(f"{BASE_URL}/health", timeout=2)
-                if response.status_code == 200:
-                    print("✅ Server started successfully and responding!")
-                    return process
-                else:
-                    print(f"⚠️ Server responding but status code: {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                print(f"⏳ Still waiting... ({i+1}/10) - {e}")
-                continue
-        
-        # If we get here, server didn't start properly
-        print("❌ Server failed to start within timeout")
+        deadline = time.monotonic() + 10
+        while not server.started:
+            if not thread.is_alive():
+                print("❌ Server thread has terminated")
+                return None
+            if time.monotonic() > deadline:
+                print("❌ Server failed to start within timeout")
+                server.should_exit = True
+                return None
+            time.sleep(0.01)
         
-        # Check if process is still running
-        if process.poll() is None:
-            print("⚠️ Process is still running but not responding")
-            return process
-        else:
-            print("❌ Process has terminated")
-            # Get any error output
-            stdout, stderr = process.communicate()
-            if stderr:
-                print(f"Server stderr: {stderr.decode()}")
-            return None
+        print("✅ Server started successfully and responding!")
+        return server, thread
             
     except Exception as e:
         print(f"❌ Failed to start server: {e}")
         return None
 
-def stop_server(process):
+def stop_server(handle):
     """Stop the FastAPI server"""
-    if process:
+    if handle:
+        server, thread = handle
         print("🛑 Stopping server...")
-        try:
-            process.terminate()
-            process.wait(timeout=5)
-            print("✅ Server stopped successfully")
-        except subprocess.TimeoutExpired:
+        server.should_exit = True
+        thread.join(timeout=2)
+        if thread.is_alive():
             print("⚠️ Server didn't stop gracefully, forcing...")
-            process.kill()
-            process.wait()
+            server.force_exit = True
+            thread.join(timeout=2)
+        if thread.is_alive():
+            # Daemon thread: it cannot keep the interpreter alive once the script exits
+            print("⚠️ Server thread still running, leaving it to exit with the script")
+        else:
+            print("✅ Server stopped successfully")
 
 def test_health():
     """Test health check endpoint"""
     print("🔍 Testing health check...")
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = CLIENT.get(f"{BASE_URL}/health", timeout=5)
         if response.status_code == 200:
             print("✅ Health check passed")
-            print(f"Response: {response.json()}")
+            if VERBOSE:
+                print(f"Response: {response.json()}")
             return True
         else:
             print(f"❌ Health check failed: {response.status_code}")
@@ -101,10 +94,11 @@ def test_api_docs():
     """Test API documentation endpoint"""
     print("\n🔍 Testing API docs...")
     try:
-        response = requests.get(f"{BASE_URL}/api-docs", timeout=5)
+        response = CLIENT.get(f"{BASE_URL}/api-docs", timeout=5)
         if response.status_code == 200:
             print("✅ API docs endpoint working")
-            print(f"Available endpoints: {list(response.json()['endpoints'].keys())}")
+            if VERBOSE:
+                print(f"Available endpoints: {list(response.json()['endpoints'].keys())}")
             return True
         else:
             print(f"❌ API docs failed: {response.status_code}")
@@ -171,7 +165,7 @@ Nice to have:
     }
     
     try:
-        response = requests.post(
+        response = CLIENT.post(
             f"{BASE_URL}/calculate-fitscore",
             json=sample_data,
             headers={"Content-Type": "application/json"},
@@ -203,7 +197,7 @@ def test_form_endpoint():
     }
     
     try:
-        response = requests.post(
+        response = CLIENT.post(
             f"{BASE_URL}/calculate-fitscore-form",
             data=form_data,
             timeout=30
@@ -236,8 +230,8 @@ def main():
     print(f"Files in current directory: {os.listdir('.')}")
     
     # Start the server
-    server_process = start_server()
-    if not server_process:
+    server = start_server()
+    if not server:
         print("❌ Failed to start server. Exiting.")
         sys.exit(1)
     
@@ -270,7 +264,7 @@ def main():
             
     finally:
         # Always stop the server
-        stop_server(server_process)
+        stop_server(server)
 
 if __name__ == "__main__":
     main() 
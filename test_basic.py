@@ -1,192 +1,96 @@
-#!/usr/bin/env python3
 """
-Basic test script for the FitScore Calculator FastAPI application
+Basic tests for the FitScore Calculator FastAPI application
 Tests basic functionality without requiring OpenAI API key
+
+Run with `python -m pytest`; the client fixture in conftest.py calls the app in-process.
 """
 
-import requests
-import subprocess
-import time
-import sys
+import json
 import os
+from typing import Dict, Tuple
 
-# API base URL
-BASE_URL = "http://localhost:8000"
+# Decode and print response bodies that pass/fail does not need (FITSCORE_TEST_VERBOSE=1)
+VERBOSE = os.environ.get("FITSCORE_TEST_VERBOSE") == "1"
 
-def start_server():
-    """Start the FastAPI server in the background"""
-    print("🚀 Starting FastAPI server...")
-    try:
-        # Check if main.py exists
-        if not os.path.exists("main.py"):
-            print("❌ main.py not found!")
-            return None
-        
-        # Start the server in the background with more verbose output
-        process = subprocess.Popen([
-            sys.executable, "-m", "uvicorn", 
-            "main:app", 
-            "--host", "0.0.0.0", 
-            "--port", "8000",
-            "--log-level", "info"
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        print(f"✅ Server process started with PID: {process.pid}")
-        
-        # Wait longer for server to start
-        print("⏳ Waiting for server to start...")
-        for i in range(10):  # Wait up to 10 seconds
-            time.sleep(1)
-            try:
-                response = requests.get(f"{BASE_URL}/health", timeout=2)
-                if response.status_code == 200:
-                    print("✅ Server started successfully and responding!")
-                    return process
-                else:
-                    print(f"⚠️ Server responding but status code: {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                print(f"⏳ Still waiting... ({i+1}/10) - {e}")
-                continue
-        
-        # If we get here, server didn't start properly
-        print("❌ Server failed to start within timeout")
-        
-        # Check if process is still running
-        if process.poll() is None:
-            print("⚠️ Process is still running but not responding")
-            return process
-        else:
-            print("❌ Process has terminated")
-            # Get any error output
-            stdout, stderr = process.communicate()
-            if stderr:
-                print(f"Server stderr: {stderr.decode()}")
-            return None
-            
-    except Exception as e:
-        print(f"❌ Failed to start server: {e}")
-        return None
+# Status and body of the static documentation pages, fetched once per test session
+_STATIC_RESPONSES: Dict[str, Tuple[int, str]] = {}
 
-def stop_server(process):
-    """Stop the FastAPI server"""
-    if process:
-        print("🛑 Stopping server...")
-        try:
-            process.terminate()
-            process.wait(timeout=5)
-            print("✅ Server stopped successfully")
-        except subprocess.TimeoutExpired:
-            print("⚠️ Server didn't stop gracefully, forcing...")
-            process.kill()
-            process.wait()
+async def get_static(client, path: str) -> Tuple[int, str]:
+    """GET a page that never changes while the app runs, reusing an earlier fetch"""
+    if path not in _STATIC_RESPONSES:
+        response = await client.get(path, timeout=5)
+        _STATIC_RESPONSES[path] = (response.status_code, response.text)
+    return _STATIC_RESPONSES[path]
 
-def test_health():
+async def test_health(client):
     """Test health check endpoint"""
-    print("🔍 Testing health check...")
-    try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        if response.status_code == 200:
-            print("✅ Health check passed")
-            print(f"Response: {response.json()}")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Health check error: {e}")
-        return False
+    response = await client.get("/health", timeout=5)
+    assert response.status_code == 200, f"Health check failed: {response.status_code}"
+    if VERBOSE:
+        print(f"Response: {response.json()}")
 
-def test_api_docs():
+async def test_api_docs(client):
     """Test API documentation endpoint"""
-    print("\n🔍 Testing API docs...")
-    try:
-        response = requests.get(f"{BASE_URL}/api-docs", timeout=5)
-        if response.status_code == 200:
-            print("✅ API docs endpoint working")
-            print(f"Available endpoints: {list(response.json()['endpoints'].keys())}")
-            return True
-        else:
-            print(f"❌ API docs failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ API docs error: {e}")
-        return False
+    status, body = await get_static(client, "/api-docs")
+    assert status == 200, f"API docs failed: {status}"
+    if VERBOSE:
+        print(f"Available endpoints: {list(json.loads(body)['endpoints'].keys())}")
 
-def test_root_endpoint():
+async def test_root_endpoint(client):
     """Test root endpoint"""
-    print("\n🔍 Testing root endpoint...")
-    try:
-        response = requests.get(f"{BASE_URL}/", timeout=5)
-        if response.status_code == 200:
-            print("✅ Root endpoint working")
-            return True
-        else:
-            print(f"❌ Root endpoint failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Root endpoint error: {e}")
-        return False
+    response = await client.get("/", timeout=5)
+    assert response.status_code == 200, f"Root endpoint failed: {response.status_code}"
 
-def test_docs_endpoint():
+async def test_docs_endpoint(client):
     """Test docs endpoint"""
-    print("\n🔍 Testing docs endpoint...")
-    try:
-        response = requests.get(f"{BASE_URL}/docs", timeout=5)
-        if response.status_code == 200:
-            print("✅ Docs endpoint working")
-            return True
-        else:
-            print(f"❌ Docs endpoint failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Docs endpoint error: {e}")
-        return False
+    status, _ = await get_static(client, "/docs")
+    assert status == 200, f"Docs endpoint failed: {status}"
+
+async def test_bulk_endpoint_returns_one_result_per_id(client):
+    """Bulk scoring without GPT-4 returns a result for every resume id, in input order"""
+    resumes = [
+        {"id": "alice", "text": "Software Engineer at Google. Python, React, AWS. MIT graduate."},
+        {"id": "bob", "text": "Data Analyst at a bank. SQL, Excel. State University."},
+        {"id": "carol", "text": "Engineering Manager at Stripe. Go, Kubernetes. Stanford graduate."}
+    ]
+    response = await client.post("/calculate-fitscore/bulk", json={
+        "job_description": "Looking for a Python engineer with AWS experience.",
+        "resumes": resumes,
+        "use_gpt4": False
+    }, timeout=30)
+    assert response.status_code == 200, f"Bulk endpoint failed: {response.status_code}"
+    results = response.json()["results"]
+    assert [result["id"] for result in results] == [resume["id"] for resume in resumes]
+    assert all("total_score" in result for result in results)
+
+async def test_unknown_batch_returns_404(client):
+    """Polling a batch id that was never submitted is a 404"""
+    response = await client.get("/batch/batch-does-not-exist", timeout=5)
+    assert response.status_code == 404, f"Unknown batch returned: {response.status_code}"
 
-def main():
-    """Run basic tests"""
-    print("🚀 Starting Basic FitScore Calculator API Tests")
-    print("=" * 50)
+async def test_batch_routes_report_progress_then_results(client, monkeypatch):
+    """/batch/{batch_id} answers in_progress until the batch is collected, then 404"""
+    import main
     
-    # Check if we're in the right directory
-    print(f"Current directory: {os.getcwd()}")
-    print(f"Files in current directory: {os.listdir('.')}")
+    polls = iter([None, []])
     
-    # Start the server
-    server_process = start_server()
-    if not server_process:
-        print("❌ Failed to start server. Exiting.")
-        sys.exit(1)
+    async def submit_fitscore_batch_async(resumes, job_description):
+        return "batch-test"
     
-    try:
-        # Run tests
-        tests_passed = 0
-        total_tests = 4
-        
-        if test_health():
-            tests_passed += 1
-        
-        if test_api_docs():
-            tests_passed += 1
-        
-        if test_root_endpoint():
-            tests_passed += 1
-        
-        if test_docs_endpoint():
-            tests_passed += 1
-        
-        print("\n" + "=" * 50)
-        print(f"🎉 Basic tests completed! {tests_passed}/{total_tests} tests passed")
-        
-        if tests_passed == total_tests:
-            print("✅ All basic tests passed!")
-            sys.exit(0)
-        else:
-            print("❌ Some basic tests failed!")
-            sys.exit(1)
-            
-    finally:
-        # Always stop the server
-        stop_server(server_process)
-
-if __name__ == "__main__":
-    main() 
+    async def collect_fitscore_batch_async(batch_id):
+        return next(polls)
+    
+    monkeypatch.setattr(main.calculator, "submit_fitscore_batch_async", submit_fitscore_batch_async)
+    monkeypatch.setattr(main.calculator, "collect_fitscore_batch_async", collect_fitscore_batch_async)
+    
+    response = await client.post("/batch/submit", json={"resumes": ["resume"], "job_description": "job"}, timeout=5)
+    assert response.json() == {"batch_id": "batch-test", "status": "submitted"}
+    
+    response = await client.get("/batch/batch-test", timeout=5)
+    assert response.json() == {"batch_id": "batch-test", "status": "in_progress"}
+    
+    response = await client.get("/batch/batch-test", timeout=5)
+    assert response.json() == {"batch_id": "batch-test", "status": "completed", "results": []}
+    
+    response = await client.get("/batch/batch-test", timeout=5)
+    assert response.status_code == 404
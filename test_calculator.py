@@ -0,0 +1,264 @@
+"""
+Unit tests for FitScoreCalculator that need no server and no OpenAI API key
+"""
+
+import copy
+import os
+import pickle
+
+import pytest
+
+import fitscore_calculator
+from fitscore_calculator import FitScoreCalculator, _parse_tenure_years
+
+RESUME = """Jane Doe
+Senior Software Engineer
+
+EDUCATION:
+Stanford University
+Master of Science in Computer Science
+
+EXPERIENCE:
+Staff Engineer
+Stripe
+2019-2024 (5 years)
+- Led payments infrastructure team
+- Python, Go, AWS, Kubernetes
+
+SKILLS:
+Python, Go, AWS, Kubernetes, PostgreSQL"""
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+Fintech startup
+
+Requirements:
+- 5+ years of backend experience
+- Python, AWS, Kubernetes
+- Leadership experience preferred"""
+
+@pytest.fixture
+def calculator(monkeypatch):
+    """Calculator without an OpenAI client, so every step uses the fallbacks"""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    return FitScoreCalculator()
+
+def test_result_round_trips_through_pickle_and_copy(calculator):
+    """Frozen, slotted results still pickle, copy and deepcopy"""
+    result = calculator.calculate_fitscore(RESUME, JOB_DESCRIPTION, use_gpt4=False)
+    for restored in (pickle.loads(pickle.dumps(result)), copy.copy(result), copy.deepcopy(result)):
+        assert restored == result
+    assert copy.deepcopy(result).details is not result.details
+
+def test_cached_responses_are_copies(calculator):
+    """Editing a response read from the GPT-4 cache leaves the cached entry intact"""
+    cache_key = calculator._gpt_cache_key("smart_criteria", JOB_DESCRIPTION)
+    calculator._cache_response(cache_key, {"mission_critical_skills": [{"skill": "python"}]})
+    
+    cached = calculator._get_cached_response(cache_key)
+    cached["mission_critical_skills"].append({"skill": "cobol"})
+    
+    assert calculator._get_cached_response(cache_key) == {"mission_critical_skills": [{"skill": "python"}]}
+
+def test_changed_system_prompt_misses_the_cache(calculator, monkeypatch):
+    """Replies cached for a step's old system prompt are not served after the prompt changes"""
+    calculator._cache_response(calculator._gpt_cache_key("smart_criteria", JOB_DESCRIPTION), {"technical_complexity": "high"})
+    
+    monkeypatch.setitem(fitscore_calculator.GPT4_SYSTEM_PROMPTS, "smart_criteria", "Rewritten instructions")
+    
+    assert calculator._get_cached_response(calculator._gpt_cache_key("smart_criteria", JOB_DESCRIPTION)) is None
+
+def test_expired_disk_cache_entries_are_ignored(monkeypatch, tmp_path):
+    """Persisted replies older than GPT_CACHE_TTL_SECONDS are fetched again"""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    cache_key = FitScoreCalculator()._gpt_cache_key("smart_criteria", JOB_DESCRIPTION)
+    FitScoreCalculator(gpt_cache_dir=str(tmp_path))._cache_response(cache_key, {"technical_complexity": "high"})
+    
+    assert FitScoreCalculator(gpt_cache_dir=str(tmp_path))._get_cached_response(cache_key) == {"technical_complexity": "high"}
+    
+    stale = os.path.getmtime(tmp_path / f"{cache_key}.json") - fitscore_calculator.GPT_CACHE_TTL_SECONDS - 1
+    os.utime(tmp_path / f"{cache_key}.json", (stale, stale))
+    assert FitScoreCalculator(gpt_cache_dir=str(tmp_path))._get_cached_response(cache_key) is None
+
+async def test_copies_with_the_same_key_share_one_concurrency_cap(calculator):
+    """with_client copies share a completion semaphore per API key, not one per copy"""
+    class Client:
+        def __init__(self, api_key):
+            self.api_key = api_key
+    
+    first, second = calculator.with_client(Client("key-a")), calculator.with_client(Client("key-a"))
+    other = calculator.with_client(Client("key-b"))
+    
+    semaphore = first._completion_semaphore()
+    assert second._completion_semaphore() is semaphore
+    assert other._completion_semaphore() is not semaphore
+
+# Canned GPT-4 replies by step, in the shapes of the Structured Outputs schemas
+CANNED_REPLIES = {
+    "context": {
+        "industry": "fintech", "company_type": "startup", "role_type": "technical", "role_level": "senior",
+        "key_requirements": [], "preferences": [], "company_size": "small", "growth_stage": "series_a"
+    },
+    "smart_criteria": {
+        "mission_critical_skills": [{"skill": "python", "description": "Backend services", "importance": "critical"}],
+        "technical_complexity": "high"
+    },
+    "weights": {
+        "education": 0.2, "career_trajectory": 0.2, "company_relevance": 0.15, "tenure_stability": 0.15,
+        "most_important_skills": 0.2, "bonus_signals": 0.05, "red_flags": -0.15, "reasoning": "default"
+    },
+    "skills": {
+        "candidate_skills": [], "required_skills": [], "skill_matches": [],
+        "missing_critical_skills": [], "inferred_skills": []
+    },
+    "elite_evaluation": {
+        "overall_elite_score": {"score": 5, "strengths": [], "concerns": [], "recommendation": "staged"}
+    }
+}
+
+BULK_ELITE_EVALUATION = {
+    "overall_elite_score": {"score": 8, "strengths": [], "concerns": [], "recommendation": "bulk"}
+}
+
+async def test_bulk_reply_missing_a_candidate_falls_back_to_staged_calls(calculator, monkeypatch):
+    """A candidate the bulk reply leaves out is scored with its own skills and elite calls"""
+    steps = []
+    
+    async def chat_completion_json(step, prompt, local=False):
+        steps.append(step)
+        if step == "bulk":
+            # Only the first of the two numbered candidates comes back
+            return {"results": [
+                {"candidate": 1, "skills": CANNED_REPLIES["skills"], "elite_evaluation": BULK_ELITE_EVALUATION}
+            ]}
+        return CANNED_REPLIES[step]
+    
+    calculator.client = object()
+    monkeypatch.setattr(calculator, "_chat_completion_json", chat_completion_json)
+    
+    resumes = [RESUME, RESUME.replace("Jane Doe", "John Roe")]
+    results = await calculator.calculate_fitscore_bulk_async(resumes, JOB_DESCRIPTION)
+    
+    assert len(results) == 2
+    assert steps.count("bulk") == 1
+    assert sorted(step for step in steps if step in ("skills", "elite_evaluation")) == ["elite_evaluation", "skills"]
+    assert results[0].details["elite_evaluation"] == BULK_ELITE_EVALUATION
+    assert results[1].details["elite_evaluation"] == CANNED_REPLIES["elite_evaluation"]
+
+async def test_batch_submit_then_collect(calculator, monkeypatch):
+    """A submitted batch reads as in progress until the Batch API finishes, then yields results once"""
+    polls = iter([None, {"0:skills": CANNED_REPLIES["skills"], "0:elite_evaluation": BULK_ELITE_EVALUATION}])
+    submitted = []
+    
+    async def chat_completion_json(step, prompt, local=False):
+        return CANNED_REPLIES[step]
+    
+    async def submit_batch_job(requests):
+        submitted.append(requests)
+        return "batch-1"
+    
+    async def collect_batch_job(batch_id):
+        return next(polls)
+    
+    calculator.client = object()
+    monkeypatch.setattr(calculator, "_chat_completion_json", chat_completion_json)
+    monkeypatch.setattr(calculator, "_submit_batch_job", submit_batch_job)
+    monkeypatch.setattr(calculator, "_collect_batch_job", collect_batch_job)
+    
+    batch_id = await calculator.submit_fitscore_batch_async([RESUME], JOB_DESCRIPTION)
+    assert batch_id == "batch-1"
+    assert sorted(request["custom_id"] for request in submitted[0]) == ["0:elite_evaluation", "0:skills"]
+    
+    assert await calculator.collect_fitscore_batch_async(batch_id) is None
+    results = await calculator.collect_fitscore_batch_async(batch_id)
+    assert len(results) == 1
+    assert results[0].details["elite_evaluation"] == BULK_ELITE_EVALUATION
+    
+    assert results[0].details["gpt4_enhanced"] is True
+    
+    with pytest.raises(KeyError):
+        await calculator.collect_fitscore_batch_async(batch_id)
+
+async def test_failed_batch_falls_back_without_claiming_gpt4(calculator, monkeypatch):
+    """Candidates of a failed batch get the fallback analysis and are not marked GPT-4 enhanced"""
+    async def chat_completion_json(step, prompt, local=False):
+        return CANNED_REPLIES[step]
+    
+    async def submit_batch_job(requests):
+        return "batch-1"
+    
+    async def collect_batch_job(batch_id):
+        return {}
+    
+    calculator.client = object()
+    monkeypatch.setattr(calculator, "_chat_completion_json", chat_completion_json)
+    monkeypatch.setattr(calculator, "_submit_batch_job", submit_batch_job)
+    monkeypatch.setattr(calculator, "_collect_batch_job", collect_batch_job)
+    
+    results = await calculator.calculate_fitscore_batch_async([RESUME], JOB_DESCRIPTION, use_batch_api=True)
+    
+    assert results[0].details["gpt4_enhanced"] is False
+    assert results[0].details["elite_evaluation"] != CANNED_REPLIES["elite_evaluation"]
+
+@pytest.mark.parametrize("duration, years", [
+    ("2020-2023", 3),
+    ("2021-2024 (3 years)", 3.0),
+    ("Jan 2020 - present (2 years)", 2.0),
+    ("3 years", 3.0),
+    ("2.5 years", 2.5),
+    ("1 year", 1.0),
+    ("18 months", 1.5),
+    ("4", 4.0),
+    # Open-ended ranges are not parsed and get the one-year default
+    ("2020-Present", 1.0),
+    ("2019 - Current", 1.0),
+    ("Summer internship", 1.0),
+    ("Unknown", 0.0),
+    ("", 0.0),
+])
+def test_parse_tenure_years(duration, years):
+    """Duration strings parse to the years the tenure score averages"""
+    assert _parse_tenure_years(duration) == pytest.approx(years)
+
+CAREER_RESUME = """John Roe
+Engineering Manager
+
+EXPERIENCE:
+Software Engineer
+Acme Inc
+2015-2018 (3 years)
+- Built billing services
+
+Engineering Manager
+Google
+2018-2020
+- Led a team of 8 engineers and owned the platform roadmap
+
+SKILLS:
+Python, AWS"""
+
+def test_career_trajectory_and_tenure_scores(calculator):
+    """A fixed two-position resume keeps its career trajectory and tenure sub-scores"""
+    result = calculator.calculate_fitscore(CAREER_RESUME, JOB_DESCRIPTION, use_gpt4=False)
+    
+    assert result.career_trajectory_score == pytest.approx(6.0)
+    assert result.details["career_trajectory"]["leadership_roles"] == 2
+    assert result.tenure_stability_score == pytest.approx(8.7)
+    assert result.details["tenure_stability"]["average_tenure"] == pytest.approx(2.5)
+    assert result.details["tenure_stability"]["elite_tenure_bonus"] == pytest.approx(0.2)
+
+def test_keyword_indexes_match_without_the_automaton(calculator, monkeypatch):
+    """The substring fallback finds exactly what the Aho-Corasick automaton finds"""
+    pytest.importorskip("ahocorasick")
+    monkeypatch.setattr(fitscore_calculator, "ahocorasick", None)
+    fallback = FitScoreCalculator()
+    
+    texts = [
+        RESUME.lower(), CAREER_RESUME.lower(), JOB_DESCRIPTION.lower(),
+        "stanford", "massachusetts institute of technology", ""
+    ]
+    for name in ("_skills_index", "_signal_index", "_elite_company_index", "_school_index", "_tiered_school_index"):
+        index, substring_index = getattr(calculator, name), getattr(fallback, name)
+        assert index._automaton is not None and substring_index._automaton is None
+        for text in texts + list(index.keywords):
+            assert substring_index.find(text) == index.find(text)
+            assert substring_index.contains_any(text) == index.contains_any(text)